@@ -32,13 +32,27 @@ import random
 import sys
 
 # --- Configuración ---
-pygame.init()
 WIDTH, HEIGHT = 1000, 700
-SCREEN = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption('Clue: ¿Quién arruinó el platillo?')
-FONT = pygame.font.SysFont('arial', 20)
-TITLE_FONT = pygame.font.SysFont('arial', 36, bold=True)
-CLOCK = pygame.time.Clock()
+# Se crean en iniciar(); importar el módulo no abre ninguna ventana
+SCREEN = None
+FONT = None
+TITLE_FONT = None
+CLOCK = None
+
+
+def iniciar():
+    """Inicializa sólo lo que usa el juego: pantalla y fuentes.
+
+    pygame.init() también levantaría audio, joystick, etc., que el juego no usa.
+    """
+    global SCREEN, FONT, TITLE_FONT, CLOCK
+    pygame.display.init()
+    pygame.font.init()
+    SCREEN = pygame.display.set_mode((WIDTH, HEIGHT))
+    pygame.display.set_caption('Clue: ¿Quién arruinó el platillo?')
+    FONT = pygame.font.SysFont('arial', 20)
+    TITLE_FONT = pygame.font.SysFont('arial', 36, bold=True)
+    CLOCK = pygame.time.Clock()
 
 # Datos del juego (en español)
 SUSPECTS = ["Chef Camila", "Sous Chef Mateo", "Pastelera Luna", "Mesero Tomás", "Lavaplatos Nico"]
@@ -516,4 +530,5 @@ def generar_pista_extra(state, guess):
     return random.choice(opciones)
 
 if __name__ == '__main__':
+    iniciar()
     main_loop()
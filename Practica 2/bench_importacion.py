@@ -0,0 +1,79 @@
+# -------------------------------
+# Benchmark de carga masiva del inventario
+# -------------------------------
+# Genera un archivo de existencias de N líneas (por defecto 1,000,000),
+# lo importa, lo exporta y aplica un lote de retiros. Reporta tiempos y el
+# pico de memoria de Python (tracemalloc) para comprobar que la importación
+# usa memoria constante sin importar el tamaño del archivo.
+#
+# Uso: python bench_importacion.py [--lineas 1000000] [--formato csv|jsonl]
+
+import argparse
+import csv
+import json
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+
+from inventario_db import Inventario, RETIRO_OK
+
+
+def generar_existencias(ruta, lineas, formato):
+    with open(ruta, "w", encoding="utf-8", newline="") as f:
+        if formato == "jsonl":
+            for i in range(lineas):
+                f.write(json.dumps({"pieza": f"pn-{i:07d}", "cantidad": 100 + i % 50}) + "\n")
+        else:
+            w = csv.writer(f)
+            w.writerow(["pieza", "cantidad"])
+            for i in range(lineas):
+                w.writerow([f"pn-{i:07d}", 100 + i % 50])
+
+
+def medir(nombre, funcion):
+    tracemalloc.start()
+    inicio = time.perf_counter()
+    resultado = funcion()
+    duracion = time.perf_counter() - inicio
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{nombre:<22} {duracion:8.2f}s   pico Python: {pico / 1024:8.0f} KiB")
+    return resultado
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de carga masiva del inventario")
+    parser.add_argument("--lineas", type=int, default=1_000_000)
+    parser.add_argument("--formato", choices=["csv", "jsonl"], default="csv")
+    parser.add_argument("--lote", type=int, default=100_000, help="retiros en el lote")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        entrada = os.path.join(tmp, f"existencias.{args.formato}")
+        salida = os.path.join(tmp, f"export.{args.formato}")
+        generar_existencias(entrada, args.lineas, args.formato)
+        print(f"Archivo de {args.lineas} líneas ({os.path.getsize(entrada) / 2**20:.1f} MiB)")
+
+        with Inventario(os.path.join(tmp, "bench.db")) as inv:
+            n = medir("importar", lambda: inv.importar(entrada))
+            assert n == args.lineas, (n, args.lineas)
+            medir("importar (sumar)", lambda: inv.importar(entrada, sumar=True))
+            medir("exportar", lambda: inv.exportar(salida))
+
+            rnd = random.Random(0)
+            operaciones = (
+                (f"pn-{rnd.randrange(args.lineas):07d}", rnd.randint(1, 5), "bench")
+                for _ in range(args.lote)
+            )
+            reporte = medir(f"lote de {args.lote} retiros", lambda: inv.retirar_lote(operaciones))
+            ok = sum(1 for r in reporte if r[3] == RETIRO_OK)
+            print(f"  {ok}/{len(reporte)} retiros aplicados")
+
+            filas = medir("página 20 (filtro)", lambda: inv.pagina("pn-00001", 20))
+            print(f"  primera pieza: {filas[0][0] if filas else '-'}")
+
+
+if __name__ == "__main__":
+    main()
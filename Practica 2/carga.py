@@ -0,0 +1,115 @@
+# -------------------------------
+# Generador de carga para el servidor SMT
+# -------------------------------
+# Simula cientos de técnicos conectados a la vez. Cada técnico saluda,
+# consulta el inventario y hace retiros siguiendo el diálogo del chatbot.
+# Se mide la latencia de cada turno (envío de la línea -> indicación "> ")
+# y al final se reportan percentiles.
+#
+# Sin --port levanta su propio servidor con una base temporal.
+#
+# Uso: python carga.py [--tecnicos 300] [--rondas 5] [--port 8765]
+
+import argparse
+import asyncio
+import os
+import random
+import tempfile
+import time
+
+from inventario_db import Inventario
+from servidor import HOST, iniciar_servidor
+
+PIEZAS_CARGA = ["nozzle", "rodillo", "sensor", "correa"]
+
+
+async def leer_turno(reader):
+    """Lee líneas hasta la indicación del servidor; devuelve las líneas."""
+    lineas = []
+    while True:
+        linea = await reader.readline()
+        if not linea:
+            return lineas
+        linea = linea.decode("utf-8").rstrip("\n")
+        lineas.append(linea)
+        if linea.startswith("> "):
+            return lineas
+
+
+async def turno(reader, writer, texto, latencias):
+    inicio = time.perf_counter()
+    writer.write((texto + "\n").encode("utf-8"))
+    await writer.drain()
+    lineas = await leer_turno(reader)
+    latencias.append(time.perf_counter() - inicio)
+    return lineas
+
+
+async def tecnico(host, port, numero, rondas, latencias, semilla):
+    rnd = random.Random(semilla)
+    reader, writer = await asyncio.open_connection(host, port)
+    await leer_turno(reader)  # bienvenida
+    retiros = 0
+    for _ in range(rondas):
+        await turno(reader, writer, "hola", latencias)
+        await turno(reader, writer, "consultar inventario", latencias)
+        # Texto desconocido -> "no" -> flujo de retiro
+        await turno(reader, writer, "pieza desconocida", latencias)
+        await turno(reader, writer, "no", latencias)
+        await turno(reader, writer, rnd.choice(PIEZAS_CARGA), latencias)
+        await turno(reader, writer, str(rnd.randint(1, 3)), latencias)
+        lineas = await turno(reader, writer, f"tecnico-{numero}", latencias)
+        if any(l.startswith("Registro completado") for l in lineas):
+            retiros += 1
+    writer.write(b"salir\n")
+    await writer.drain()
+    writer.close()
+    return retiros
+
+
+def percentil(valores, p):
+    k = min(len(valores) - 1, int(round(p / 100 * (len(valores) - 1))))
+    return valores[k]
+
+
+async def main(args):
+    server = escritor = tmp = None
+    host, port = args.host, args.port
+    if port is None:
+        tmp = tempfile.TemporaryDirectory()
+        filename = os.path.join(tmp.name, "carga.db")
+        with Inventario(filename) as inv:
+            inv.sembrar({pieza: 1_000_000 for pieza in PIEZAS_CARGA})
+        server, escritor = await iniciar_servidor(host, 0, filename)
+        port = server.sockets[0].getsockname()[1]
+
+    latencias = []
+    inicio = time.perf_counter()
+    retiros = await asyncio.gather(*[
+        tecnico(host, port, i, args.rondas, latencias, i) for i in range(args.tecnicos)
+    ])
+    duracion = time.perf_counter() - inicio
+
+    if server is not None:
+        server.close()
+        await server.wait_closed()
+        await escritor.detener()
+        escritor.inventario.close()
+        tmp.cleanup()
+
+    latencias.sort()
+    ms = [x * 1000 for x in latencias]
+    print(f"Técnicos: {args.tecnicos}  rondas: {args.rondas}  turnos: {len(ms)}  retiros: {sum(retiros)}")
+    print(f"Duración: {duracion:.2f}s  ({len(ms) / duracion:.0f} turnos/s)")
+    print("Latencia (ms): p50={:.2f} p90={:.2f} p99={:.2f} max={:.2f}".format(
+        percentil(ms, 50), percentil(ms, 90), percentil(ms, 99), ms[-1]))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generador de carga para el servidor SMT")
+    parser.add_argument("--host", default=HOST)
+    parser.add_argument("--port", type=int, default=None,
+                        help="puerto de un servidor ya iniciado (por defecto se levanta uno temporal)")
+    parser.add_argument("--tecnicos", type=int, default=300)
+    parser.add_argument("--rondas", type=int, default=5)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,35 @@
+# -------------------------------
+# Datos iniciales del chatbot SMT
+# -------------------------------
+# Compartidos por el chatbot de consola (Practica 2) y el servidor multi-cliente.
+
+# -------------------------------
+# Inventario inicial (se siembra en la base si la pieza no existe)
+# -------------------------------
+INVENTARIO_INICIAL = {
+    "nozzle": 10,
+    "rodillo": 5,
+    "sensor": 7,
+    "correa": 3
+}
+
+# -------------------------------
+# Base de conocimiento inicial enriquecida
+# -------------------------------
+CONOCIMIENTO_INICIAL = {
+    "hola": "Hola! Bienvenido al sistema de inventario SMT.",
+    "como estas": "¡Todo bien! Vamos a registrar tus retiros de refacciones.",
+    "de que te gustaria hablar": "Podemos hablar de inventario. Indícame qué refacción necesitas.",
+    
+    # Frases comunes sobre solicitar piezas
+    "necesito esta pieza": "¡Claro! Dime qué refacción necesitas y la cantidad.",
+    "dame esta pieza": "Perfecto, indícame cuál refacción y cuántas unidades.",
+    "podrias darme esta pieza": "Sí, por favor dime la refacción y la cantidad.",
+    "tienes esta pieza": "Verifiquemos el inventario. ¿Qué refacción necesitas?",
+    "quiero esta pieza": "Dime cuál refacción deseas y la cantidad.",
+    "solicito esta pieza": "Entendido. Indícame la refacción y cuántas unidades.",
+    "retirar pieza": "Perfecto. ¿Cuál refacción quieres retirar y en qué cantidad?",
+    "consultar inventario": "Aquí está el inventario actual:",
+    "mostrar inventario": "Te muestro el inventario:",
+    "hay stock de": "Verifiquemos el stock. ¿Qué refacción deseas consultar?"
+}
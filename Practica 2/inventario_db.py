@@ -0,0 +1,487 @@
+# -------------------------------
+# Libro de inventario persistente (SQLite en modo WAL)
+# -------------------------------
+# Sustituye a los diccionarios en memoria del chatbot SMT:
+# - inventario: existencias por refacción.
+# - retiros: bitácora de solo anexado (pieza, cantidad, quién, fecha).
+# - conocimiento: preguntas/respuestas aprendidas por el chatbot.
+#
+# Cada retiro es una transacción atómica de "verificar y descontar", de modo
+# que varios procesos pueden retirar al mismo tiempo sin sobrevender.
+#
+# Uso por línea de comandos (carga masiva y consultas):
+#   python inventario_db.py importar existencias.csv [--sumar]
+#   python inventario_db.py exportar existencias.jsonl
+#   python inventario_db.py lote retiros.csv [--reporte reporte.csv]
+#   python inventario_db.py listar [--filtro nozzle] [--tamano 20] [--despues-de pieza]
+
+import argparse
+import csv
+import json
+import os
+import sqlite3
+import sys
+import time
+
+DB_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "inventario.db")
+
+# Tiempo máximo (segundos) que una conexión espera el candado de escritura
+ESPERA_CANDADO = 60.0
+
+# Resultados posibles de un retiro
+RETIRO_OK = "ok"
+SIN_STOCK = "sin_stock"
+NO_EXISTE = "no_existe"
+CANTIDAD_INVALIDA = "cantidad_invalida"
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS inventario (
+    pieza    TEXT PRIMARY KEY,
+    cantidad INTEGER NOT NULL CHECK (cantidad >= 0)
+);
+
+CREATE TABLE IF NOT EXISTS retiros (
+    id       INTEGER PRIMARY KEY AUTOINCREMENT,
+    pieza    TEXT NOT NULL,
+    cantidad INTEGER NOT NULL,
+    quien    TEXT NOT NULL,
+    fecha    REAL NOT NULL
+);
+
+CREATE TRIGGER IF NOT EXISTS retiros_sin_update BEFORE UPDATE ON retiros
+BEGIN
+    SELECT RAISE(ABORT, 'la bitácora de retiros es de solo anexado');
+END;
+
+CREATE TRIGGER IF NOT EXISTS retiros_sin_delete BEFORE DELETE ON retiros
+BEGIN
+    SELECT RAISE(ABORT, 'la bitácora de retiros es de solo anexado');
+END;
+
+CREATE TABLE IF NOT EXISTS conocimiento (
+    pregunta  TEXT PRIMARY KEY,
+    respuesta TEXT NOT NULL
+);
+"""
+
+
+class Inventario:
+    """Inventario SMT respaldado por SQLite.
+
+    Una instancia por proceso (o por hilo). Las lecturas de existencias salen
+    de una vista en caché que sólo se recarga cuando otra conexión confirma
+    cambios en la base (``PRAGMA data_version``).
+    """
+
+    def __init__(self, filename=DB_FILE):
+        self.filename = filename
+        # isolation_level=None: las transacciones se controlan a mano con BEGIN
+        self.conn = sqlite3.connect(filename, timeout=ESPERA_CANDADO, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self._crear_esquema()
+        self._cache = {}
+        self._completa = False
+        self._version = None
+
+    def _crear_esquema(self):
+        # executescript no respeta el timeout si otra conexión tiene el
+        # candado, así que se reintenta mientras la base esté ocupada.
+        limite = time.monotonic() + ESPERA_CANDADO
+        while True:
+            try:
+                self.conn.executescript(ESQUEMA)
+                return
+            except sqlite3.OperationalError as e:
+                if "locked" not in str(e) or time.monotonic() > limite:
+                    raise
+                time.sleep(0.01)
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ----------------- Vista materializada en caché -----------------
+    def _refrescar(self):
+        """Vacía la caché si otra conexión confirmó cambios desde la última lectura."""
+        version = self.conn.execute("PRAGMA data_version").fetchone()[0]
+        if version != self._version:
+            self._cache = {}
+            self._completa = False
+            self._version = version
+
+    def existencias(self):
+        """Devuelve {pieza: cantidad}. No modificar el diccionario devuelto.
+
+        Carga el inventario completo; para inventarios grandes usar pagina().
+        """
+        self._refrescar()
+        if not self._completa:
+            self._cache = dict(self.conn.execute("SELECT pieza, cantidad FROM inventario ORDER BY pieza"))
+            self._completa = True
+        return self._cache
+
+    def stock(self, pieza):
+        """Existencia de una pieza (None si no existe), sin cargar todo el inventario."""
+        self._refrescar()
+        if pieza in self._cache or self._completa:
+            return self._cache.get(pieza)
+        fila = self.conn.execute("SELECT cantidad FROM inventario WHERE pieza = ?", (pieza,)).fetchone()
+        cantidad = fila[0] if fila else None
+        if cantidad is not None:
+            self._cache[pieza] = cantidad
+        return cantidad
+
+    def __contains__(self, pieza):
+        return self.stock(pieza) is not None
+
+    def _anotar(self, pieza, cantidad):
+        """Refleja en la caché una escritura propia (data_version no cambia con ellas)."""
+        if cantidad is not None and self._version is not None:
+            self._cache[pieza] = cantidad
+
+    def _invalidar(self):
+        self._version = None
+
+    # ----------------- Vistas paginadas -----------------
+    def pagina(self, filtro=None, tamano=20, despues_de=None):
+        """Devuelve hasta ``tamano`` tuplas (pieza, cantidad) ordenadas por pieza.
+
+        ``filtro`` busca el texto dentro del nombre de la pieza. La paginación
+        es por llave: para la siguiente página se pasa en ``despues_de`` la
+        última pieza recibida, así el costo no crece con el número de página.
+        """
+        condiciones, params = [], []
+        if filtro:
+            condiciones.append("instr(pieza, ?) > 0")
+            params.append(filtro)
+        if despues_de is not None:
+            condiciones.append("pieza > ?")
+            params.append(despues_de)
+        where = (" WHERE " + " AND ".join(condiciones)) if condiciones else ""
+        params.append(tamano)
+        return self.conn.execute(
+            f"SELECT pieza, cantidad FROM inventario{where} ORDER BY pieza LIMIT ?", params
+        ).fetchall()
+
+    def contar(self, filtro=None):
+        if filtro:
+            return self.conn.execute("SELECT COUNT(*) FROM inventario WHERE instr(pieza, ?) > 0", (filtro,)).fetchone()[0]
+        return self.conn.execute("SELECT COUNT(*) FROM inventario").fetchone()[0]
+
+    # ----------------- Escrituras -----------------
+    def sembrar(self, inicial):
+        """Carga existencias iniciales sin pisar piezas que ya existan."""
+        with self._transaccion():
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO inventario (pieza, cantidad) VALUES (?, ?)",
+                inicial.items(),
+            )
+        self._invalidar()
+
+    def registrar_pieza(self, pieza, cantidad):
+        """Da de alta una refacción (o fija su stock si ya existía)."""
+        cantidad = int(cantidad)
+        with self._transaccion():
+            self.conn.execute(
+                "INSERT INTO inventario (pieza, cantidad) VALUES (?, ?) "
+                "ON CONFLICT(pieza) DO UPDATE SET cantidad = excluded.cantidad",
+                (pieza, cantidad),
+            )
+        self._anotar(pieza, cantidad)
+
+    def retirar(self, pieza, cantidad, quien):
+        """Descuenta ``cantidad`` de ``pieza`` y lo anota en la bitácora.
+
+        Devuelve ``(estado, stock)`` donde estado es RETIRO_OK, SIN_STOCK,
+        NO_EXISTE o CANTIDAD_INVALIDA y stock es la existencia tras la
+        operación (None si la pieza no existe).
+        """
+        try:
+            cantidad = int(cantidad)
+        except (TypeError, ValueError):
+            return CANTIDAD_INVALIDA, self.stock(pieza)
+        if cantidad <= 0:
+            return CANTIDAD_INVALIDA, self.stock(pieza)
+
+        with self._transaccion():
+            estado, restante = self._retirar_en_transaccion(pieza, cantidad, quien, time.time())
+
+        self._anotar(pieza, restante)
+        return estado, restante
+
+    def _retirar_en_transaccion(self, pieza, cantidad, quien, fecha):
+        # El WHERE hace la verificación y el descuento en una sola sentencia
+        cur = self.conn.execute(
+            "UPDATE inventario SET cantidad = cantidad - ? WHERE pieza = ? AND cantidad >= ?",
+            (cantidad, pieza, cantidad),
+        )
+        fila = self.conn.execute("SELECT cantidad FROM inventario WHERE pieza = ?", (pieza,)).fetchone()
+        if cur.rowcount == 1:
+            self.conn.execute(
+                "INSERT INTO retiros (pieza, cantidad, quien, fecha) VALUES (?, ?, ?, ?)",
+                (pieza, cantidad, quien, fecha),
+            )
+            return RETIRO_OK, fila[0]
+        if fila is None:
+            return NO_EXISTE, None
+        return SIN_STOCK, fila[0]
+
+    def retirar_lote(self, operaciones):
+        """Aplica muchos retiros en una sola transacción.
+
+        ``operaciones`` es un iterable de (pieza, cantidad, quien) y,
+        opcionalmente, el número de línea en el archivo de origen como cuarto
+        elemento (si falta se numera desde 1). Cada línea se evalúa igual que
+        retirar(); las que fallan no detienen el lote. Devuelve el reporte por
+        línea: lista de (numero, pieza, cantidad, estado, stock).
+        """
+        reporte = []
+        fecha = time.time()
+        with self._transaccion():
+            for posicion, operacion in enumerate(operaciones, start=1):
+                pieza, cantidad, quien = operacion[:3]
+                numero = operacion[3] if len(operacion) > 3 else posicion
+                try:
+                    valida = int(cantidad) > 0
+                except (TypeError, ValueError):
+                    valida = False
+                if not valida:
+                    fila = self.conn.execute("SELECT cantidad FROM inventario WHERE pieza = ?", (pieza,)).fetchone()
+                    reporte.append((numero, pieza, cantidad, CANTIDAD_INVALIDA, fila[0] if fila else None))
+                    continue
+                cantidad = int(cantidad)
+                estado, restante = self._retirar_en_transaccion(pieza, cantidad, quien, fecha)
+                reporte.append((numero, pieza, cantidad, estado, restante))
+        for _, pieza, _, _, restante in reporte:
+            self._anotar(pieza, restante)
+        return reporte
+
+    def _transaccion(self):
+        return _Transaccion(self.conn)
+
+    # ----------------- Importación / exportación -----------------
+    def importar(self, ruta, sumar=False):
+        """Carga existencias desde un CSV (pieza,cantidad) o JSONL.
+
+        El archivo se lee en streaming dentro de una sola transacción, así
+        la memoria no depende del número de líneas. Con ``sumar=True`` las
+        cantidades se suman al stock actual (reabasto); si no, lo fijan.
+        Una línea inválida lanza ValueError y no se importa nada.
+        Devuelve el número de líneas importadas.
+        """
+        if sumar:
+            sql = ("INSERT INTO inventario (pieza, cantidad) VALUES (?, ?) "
+                   "ON CONFLICT(pieza) DO UPDATE SET cantidad = cantidad + excluded.cantidad")
+        else:
+            sql = ("INSERT INTO inventario (pieza, cantidad) VALUES (?, ?) "
+                   "ON CONFLICT(pieza) DO UPDATE SET cantidad = excluded.cantidad")
+        with self._transaccion():
+            cur = self.conn.executemany(sql, leer_existencias(ruta))
+            importadas = cur.rowcount
+        self._invalidar()
+        return importadas
+
+    def exportar(self, ruta):
+        """Escribe el inventario completo a CSV o JSONL; devuelve el número de piezas."""
+        filas = self.conn.execute("SELECT pieza, cantidad FROM inventario ORDER BY pieza")
+        return escribir_existencias(ruta, filas)
+
+    # ----------------- Bitácora -----------------
+    def retiros(self, pieza=None):
+        """Itera la bitácora como tuplas (pieza, cantidad, quien, fecha)."""
+        if pieza is None:
+            return self.conn.execute("SELECT pieza, cantidad, quien, fecha FROM retiros ORDER BY id")
+        return self.conn.execute(
+            "SELECT pieza, cantidad, quien, fecha FROM retiros WHERE pieza = ? ORDER BY id", (pieza,)
+        )
+
+    # ----------------- Base de conocimiento -----------------
+    def conocimiento(self):
+        return dict(self.conn.execute("SELECT pregunta, respuesta FROM conocimiento"))
+
+    def guardar_conocimiento(self, pregunta, respuesta):
+        with self._transaccion():
+            self.conn.execute(
+                "INSERT OR REPLACE INTO conocimiento (pregunta, respuesta) VALUES (?, ?)",
+                (pregunta, respuesta),
+            )
+
+
+class _Transaccion:
+    """BEGIN IMMEDIATE ... COMMIT/ROLLBACK.
+
+    IMMEDIATE toma el candado de escritura al inicio, así dos procesos no
+    pueden leer el mismo stock y descontarlo a la vez.
+    """
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __enter__(self):
+        self.conn.execute("BEGIN IMMEDIATE")
+        return self.conn
+
+    def __exit__(self, tipo, valor, tb):
+        if tipo is None:
+            self.conn.execute("COMMIT")
+        else:
+            self.conn.execute("ROLLBACK")
+        return False
+
+
+# -------------------------------
+# Vista de texto para los chatbots (consola y servidor)
+# -------------------------------
+def lineas_pagina(inventario, filtro=None, tamano=20, despues_de=None):
+    """Texto de una página del inventario; devuelve (lineas, ultima).
+
+    ``ultima`` es la última pieza mostrada si quedan más (se pasa como
+    ``despues_de`` para la siguiente página) o None. No cuenta el total: pide
+    una fila de más para saber si hay otra página.
+    """
+    filas = inventario.pagina(filtro, tamano + 1, despues_de)
+    hay_mas = len(filas) > tamano
+    filas = filas[:tamano]
+    titulo = "Inventario actual" if despues_de is None else "Inventario (continuación)"
+    lineas = [f"{titulo}{f' (filtro: {filtro})' if filtro else ''}:"]
+    lineas += [f"- {pieza}: {cantidad} unidades" for pieza, cantidad in filas]
+    if not filas:
+        lineas.append("(sin piezas)")
+    if hay_mas:
+        lineas.append("... hay más piezas. Escribe 'siguiente' para verlas o 'buscar <texto>' para filtrar.")
+        return lineas, filas[-1][0]
+    return lineas, None
+
+
+# -------------------------------
+# Lectura / escritura de archivos (streaming)
+# -------------------------------
+def _es_jsonl(ruta):
+    return ruta.lower().endswith((".jsonl", ".ndjson"))
+
+
+def _filas_archivo(ruta, columnas):
+    """Itera (numero_de_linea, [valores...]) de un CSV o JSONL sin cargarlo entero.
+
+    En CSV la primera fila se toma como encabezado si coincide con los
+    nombres de ``columnas``.
+    """
+    # utf-8-sig: los CSV "UTF-8" de Excel empiezan con la marca de orden de bytes
+    with open(ruta, "r", encoding="utf-8-sig", newline="") as f:
+        if _es_jsonl(ruta):
+            for numero, linea in enumerate(f, start=1):
+                if not linea.strip():
+                    continue
+                try:
+                    registro = json.loads(linea)
+                    yield numero, [registro[c] for c in columnas]
+                except (ValueError, KeyError, TypeError) as e:
+                    raise ValueError(f"{ruta}:{numero}: línea inválida ({e})") from None
+        else:
+            lector = csv.reader(f)
+            for fila in lector:
+                numero = lector.line_num   # línea física (cuenta encabezado, vacías y saltos entre comillas)
+                if not fila:
+                    continue
+                if numero == 1 and [x.strip().lower() for x in fila] == list(columnas):
+                    continue
+                if len(fila) != len(columnas):
+                    raise ValueError(f"{ruta}:{numero}: se esperaban {len(columnas)} columnas")
+                yield numero, fila
+
+
+def leer_existencias(ruta):
+    """Itera (pieza, cantidad) de un archivo de existencias."""
+    for numero, (pieza, cantidad) in _filas_archivo(ruta, ("pieza", "cantidad")):
+        try:
+            cantidad = int(cantidad)
+        except (TypeError, ValueError):
+            raise ValueError(f"{ruta}:{numero}: cantidad inválida {cantidad!r}") from None
+        if cantidad < 0:
+            raise ValueError(f"{ruta}:{numero}: cantidad negativa {cantidad}")
+        yield str(pieza).strip().lower(), cantidad
+
+
+def leer_retiros(ruta):
+    """Itera (pieza, cantidad, quien, numero de línea) de un archivo de retiros."""
+    for numero, (pieza, cantidad, quien) in _filas_archivo(ruta, ("pieza", "cantidad", "quien")):
+        yield str(pieza).strip().lower(), cantidad, str(quien).strip(), numero
+
+
+def escribir_existencias(ruta, filas):
+    n = 0
+    with open(ruta, "w", encoding="utf-8", newline="") as f:
+        if _es_jsonl(ruta):
+            for pieza, cantidad in filas:
+                f.write(json.dumps({"pieza": pieza, "cantidad": cantidad}, ensure_ascii=False) + "\n")
+                n += 1
+        else:
+            w = csv.writer(f)
+            w.writerow(["pieza", "cantidad"])
+            for fila in filas:
+                w.writerow(fila)
+                n += 1
+    return n
+
+
+# -------------------------------
+# Línea de comandos
+# -------------------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Inventario SMT: carga masiva y consultas")
+    parser.add_argument("--db", default=DB_FILE, help="archivo SQLite del inventario")
+    sub = parser.add_subparsers(dest="comando", required=True)
+
+    p = sub.add_parser("importar", help="cargar existencias desde CSV/JSONL")
+    p.add_argument("archivo")
+    p.add_argument("--sumar", action="store_true", help="sumar al stock actual en vez de fijarlo")
+
+    p = sub.add_parser("exportar", help="volcar existencias a CSV/JSONL")
+    p.add_argument("archivo")
+
+    p = sub.add_parser("lote", help="aplicar retiros (pieza,cantidad,quien) en una transacción")
+    p.add_argument("archivo")
+    p.add_argument("--reporte", help="CSV con el resultado por línea (por defecto, salida estándar)")
+
+    p = sub.add_parser("listar", help="vista paginada del inventario")
+    p.add_argument("--filtro")
+    p.add_argument("--tamano", type=int, default=20)
+    p.add_argument("--despues-de", dest="despues_de")
+
+    args = parser.parse_args(argv)
+    with Inventario(args.db) as inv:
+        if args.comando == "importar":
+            n = inv.importar(args.archivo, sumar=args.sumar)
+            print(f"{n} líneas importadas")
+        elif args.comando == "exportar":
+            n = inv.exportar(args.archivo)
+            print(f"{n} piezas exportadas")
+        elif args.comando == "lote":
+            reporte = inv.retirar_lote(leer_retiros(args.archivo))
+            salida = open(args.reporte, "w", encoding="utf-8", newline="") if args.reporte else sys.stdout
+            try:
+                w = csv.writer(salida)
+                w.writerow(["linea", "pieza", "cantidad", "estado", "stock"])
+                w.writerows(reporte)
+            finally:
+                if args.reporte:
+                    salida.close()
+            ok = sum(1 for r in reporte if r[3] == RETIRO_OK)
+            print(f"{ok}/{len(reporte)} retiros aplicados", file=sys.stderr)
+        elif args.comando == "listar":
+            filas = inv.pagina(args.filtro, args.tamano, args.despues_de)
+            for pieza, cantidad in filas:
+                print(f"- {pieza}: {cantidad} unidades")
+            print(f"({len(filas)} de {inv.contar(args.filtro)} piezas)")
+            if len(filas) == args.tamano:
+                print(f"Siguiente página: --despues-de {filas[-1][0]!r}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,310 @@
+# -------------------------------
+# Servidor multi-cliente del chatbot SMT (asyncio)
+# -------------------------------
+# Expone el mismo diálogo que chatbot() en un socket local para que varios
+# técnicos lo usen a la vez. Cada conexión tiene su propia máquina de estados
+# (Conversacion) y todas las escrituras al inventario pasan por una sola
+# tarea escritora (Escritor), así nunca hay dos mutaciones en paralelo. Las
+# escrituras corren en un hilo aparte con su propia conexión: si otro proceso
+# tiene el candado de escritura, sólo espera ese hilo y no el bucle de asyncio.
+#
+# Protocolo (texto, UTF-8, una línea por mensaje):
+#   - el cliente envía una línea por respuesta;
+#   - el servidor responde con cero o más líneas "Chatbot: ..." y termina
+#     cada turno con una línea de indicación que empieza con "> ".
+#
+# Uso: python servidor.py [--host 127.0.0.1] [--port 8765]
+#      (se puede probar con: nc 127.0.0.1 8765)
+
+import argparse
+import asyncio
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+
+from datos_smt import INVENTARIO_INICIAL, CONOCIMIENTO_INICIAL
+from inventario_db import DB_FILE, Inventario, RETIRO_OK, SIN_STOCK, CANTIDAD_INVALIDA, lineas_pagina
+
+HOST = "127.0.0.1"
+PORT = 8765
+TAMANO_PAGINA = 20
+LOTE_ESCRITOR = 64   # escrituras máximas por viaje al hilo escritor
+
+# Estados de la conversación (mismos pasos que el bucle de chatbot())
+PREGUNTA = "pregunta"
+CONFIRMAR_ALTA = "confirmar_alta"
+CANTIDAD_ALTA = "cantidad_alta"
+RESPUESTA_ALTA = "respuesta_alta"
+RETIRO_PIEZA = "retiro_pieza"
+RETIRO_CANTIDAD = "retiro_cantidad"
+RETIRO_QUIEN = "retiro_quien"
+FIN = "fin"
+
+
+# -------------------------------
+# Tarea escritora: serializa las mutaciones del inventario
+# -------------------------------
+class Escritor:
+    def __init__(self, inventario, knowledge_base):
+        self.inventario = inventario   # conexión de lectura, la usa el bucle de asyncio
+        self.knowledge_base = knowledge_base
+        self.cola = asyncio.Queue()
+        self.tarea = None
+        # Un solo hilo con su propia conexión (sqlite3 no comparte conexiones
+        # entre hilos); la cola conserva el orden de llegada.
+        self._hilo = ThreadPoolExecutor(max_workers=1, thread_name_prefix="escritor")
+        self._conexion = None
+
+    def iniciar(self):
+        self.tarea = asyncio.create_task(self._bucle())
+
+    async def detener(self):
+        if self.tarea is not None:
+            self.tarea.cancel()
+            try:
+                await self.tarea
+            except asyncio.CancelledError:
+                pass
+        await asyncio.get_running_loop().run_in_executor(self._hilo, self._cerrar)
+        self._hilo.shutdown()
+
+    def _cerrar(self):
+        if self._conexion is not None:
+            self._conexion.close()
+            self._conexion = None
+
+    def _ejecutar(self, pedidos):
+        """Corre en el hilo escritor: cada pedido es su propia transacción y
+        devuelve (error, resultado) en el mismo orden."""
+        if self._conexion is None:
+            self._conexion = Inventario(self.inventario.filename)
+        salida = []
+        for metodo, args in pedidos:
+            try:
+                salida.append((None, getattr(self._conexion, metodo)(*args)))
+            except Exception as e:
+                salida.append((e, None))
+        return salida
+
+    async def _bucle(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            lote = [await self.cola.get()]
+            # Lo que ya espera en la cola va al hilo en un solo viaje
+            while len(lote) < LOTE_ESCRITOR and not self.cola.empty():
+                lote.append(self.cola.get_nowait())
+            try:
+                salida = await loop.run_in_executor(
+                    self._hilo, self._ejecutar, [(metodo, args) for metodo, args, _ in lote])
+            except Exception as e:   # no se pudo abrir la conexión
+                salida = [(e, None)] * len(lote)
+            for (_, _, futuro), (error, resultado) in zip(lote, salida):
+                if futuro.cancelled():
+                    continue
+                if error is not None:
+                    futuro.set_exception(error)
+                else:
+                    futuro.set_result(resultado)
+
+    async def _encolar(self, metodo, *args):
+        futuro = asyncio.get_running_loop().create_future()
+        await self.cola.put((metodo, args, futuro))
+        return await futuro
+
+    async def retirar(self, pieza, cantidad, quien):
+        return await self._encolar("retirar", pieza, cantidad, quien)
+
+    async def registrar_pieza(self, pieza, cantidad):
+        return await self._encolar("registrar_pieza", pieza, cantidad)
+
+    async def agregar_conocimiento(self, pregunta, respuesta):
+        await self._encolar("guardar_conocimiento", pregunta, respuesta)
+        # El diccionario sólo se toca desde el bucle
+        self.knowledge_base[pregunta] = respuesta
+
+
+# -------------------------------
+# Máquina de estados por conexión
+# -------------------------------
+class Conversacion:
+    def __init__(self, escritor):
+        self.escritor = escritor
+        self.inventario = escritor.inventario
+        self.knowledge_base = escritor.knowledge_base
+        self.estado = PREGUNTA
+        self.texto = None   # pregunta/refacción no reconocida en curso
+        self.pieza = None
+        self.cantidad = None
+        self.siguiente = None   # (filtro, última pieza) de la página mostrada, si hay más
+
+    def inicio(self):
+        salida = ["Chatbot: Hola! Bienvenido al sistema de inventario SMT."]
+        salida += self.lineas_inventario()
+        return salida, "Tú:"
+
+    def lineas_inventario(self, filtro=None, despues_de=None):
+        salida, ultima = lineas_pagina(self.inventario, filtro, TAMANO_PAGINA, despues_de)
+        self.siguiente = (filtro, ultima) if ultima is not None else None
+        return salida
+
+    def _pedir_retiro(self, salida):
+        self.estado = RETIRO_PIEZA
+        salida += self.lineas_inventario()
+        return salida, "Chatbot: ¿Qué refacción deseas retirar?"
+
+    def _volver_a_preguntar(self, salida):
+        self.estado = PREGUNTA
+        return salida, "Tú:"
+
+    def fallo(self):
+        """Respuesta a un turno que lanzó una excepción: se avisa y se vuelve a la pregunta inicial."""
+        return self._volver_a_preguntar(["Chatbot: Ocurrió un error al procesar eso. Intenta de nuevo."])
+
+    async def responder(self, entrada):
+        """Procesa una línea del cliente; devuelve (lineas, indicacion)."""
+        entrada = entrada.strip()
+        estado = self.estado
+
+        if estado == PREGUNTA:
+            texto = entrada.lower()
+            if texto in ["salir", "exit", "quit"]:
+                self.estado = FIN
+                return ["Chatbot: ¡Hasta luego!"], None
+            if texto.startswith("buscar "):
+                return self.lineas_inventario(texto[len("buscar "):].strip()), "Tú:"
+            if texto == "siguiente":
+                if self.siguiente is None:
+                    return ["Chatbot: No hay más piezas que mostrar."], "Tú:"
+                return self.lineas_inventario(*self.siguiente), "Tú:"
+            response = self.knowledge_base.get(texto)
+            if response:
+                salida = [f"Chatbot: {response}"]
+                if "inventario" in texto:
+                    salida += self.lineas_inventario()
+                return salida, "Tú:"
+            self.texto = texto
+            self.estado = CONFIRMAR_ALTA
+            return ["Chatbot: No reconozco eso. ¿Quieres agregarlo al sistema? (sí/no)"], "Tú:"
+
+        if estado == CONFIRMAR_ALTA:
+            if entrada.lower() in ["sí", "si", "s"]:
+                self.estado = CANTIDAD_ALTA
+                return [], f"Chatbot: ¿Cuántas unidades de '{self.texto}' deseas agregar?"
+            return self._pedir_retiro(["Chatbot: Entendido, no se agregará al sistema."])
+
+        if estado == CANTIDAD_ALTA:
+            if not entrada.isdecimal():
+                return ["Chatbot: Ingresa un número válido."], f"Chatbot: ¿Cuántas unidades de '{self.texto}' deseas agregar?"
+            await self.escritor.registrar_pieza(self.texto, int(entrada))
+            self.estado = RESPUESTA_ALTA
+            return (
+                [f"Chatbot: Refacción '{self.texto}' agregada con {entrada} unidades."],
+                "Chatbot: ¿Qué debería responder cuando alguien pregunte esto de nuevo?",
+            )
+
+        if estado == RESPUESTA_ALTA:
+            await self.escritor.agregar_conocimiento(self.texto, entrada)
+            return self._pedir_retiro(["¡Nuevo conocimiento agregado!"])
+
+        if estado == RETIRO_PIEZA:
+            pieza = entrada.lower()
+            if pieza == "siguiente" and self.siguiente is not None:
+                return self.lineas_inventario(*self.siguiente), "Chatbot: ¿Qué refacción deseas retirar?"
+            if pieza not in self.inventario:
+                return self._volver_a_preguntar([f"Chatbot: Lo siento, {pieza} no está en el inventario."])
+            self.pieza = pieza
+            self.estado = RETIRO_CANTIDAD
+            return [], f"Chatbot: ¿Cuántas unidades de {pieza}?"
+
+        if estado == RETIRO_CANTIDAD:
+            if not entrada.isdecimal():
+                return self._volver_a_preguntar(["Chatbot: Ingresa un número válido."])
+            self.cantidad = int(entrada)
+            self.estado = RETIRO_QUIEN
+            return [], "Chatbot: ¿Quién la retira?"
+
+        if estado == RETIRO_QUIEN:
+            pieza, cantidad, quien = self.pieza, self.cantidad, entrada
+            estado_retiro, stock = await self.escritor.retirar(pieza, cantidad, quien)
+            if estado_retiro == RETIRO_OK:
+                salida = [f"Registro completado: {quien} retiró {cantidad} de {pieza}."]
+            elif estado_retiro == SIN_STOCK:
+                salida = [f"No hay suficiente stock de {pieza}. Stock disponible: {stock}"]
+            elif estado_retiro == CANTIDAD_INVALIDA:
+                salida = ["La cantidad a retirar debe ser mayor que cero."]
+            else:
+                salida = [f"La pieza {pieza} no existe en el inventario."]
+            salida += self.lineas_inventario()
+            return self._volver_a_preguntar(salida)
+
+        return [], None
+
+
+# -------------------------------
+# Servidor
+# -------------------------------
+async def _enviar(writer, lineas, indicacion):
+    texto = "".join(linea + "\n" for linea in lineas)
+    if indicacion is not None:
+        texto += f"> {indicacion}\n"
+    writer.write(texto.encode("utf-8"))
+    await writer.drain()
+
+
+def crear_manejador(escritor):
+    async def manejar(reader, writer):
+        conversacion = Conversacion(escritor)
+        try:
+            await _enviar(writer, *conversacion.inicio())
+            while conversacion.estado != FIN:
+                linea = await reader.readline()
+                if not linea:
+                    break
+                try:
+                    lineas, indicacion = await conversacion.responder(linea.decode("utf-8", "replace"))
+                except Exception:
+                    # Un turno fallido no cierra la sesión
+                    traceback.print_exc()
+                    lineas, indicacion = conversacion.fallo()
+                await _enviar(writer, lineas, indicacion)
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+    return manejar
+
+
+async def iniciar_servidor(host=HOST, port=PORT, filename=DB_FILE):
+    """Arranca el servidor y su tarea escritora; devuelve (server, escritor)."""
+    inventario = Inventario(filename)
+    inventario.sembrar(INVENTARIO_INICIAL)
+    knowledge_base = dict(CONOCIMIENTO_INICIAL)
+    knowledge_base.update(inventario.conocimiento())
+
+    escritor = Escritor(inventario, knowledge_base)
+    escritor.iniciar()
+    # backlog amplio: cientos de técnicos pueden conectarse en el mismo instante
+    server = await asyncio.start_server(crear_manejador(escritor), host, port, backlog=1024)
+    return server, escritor
+
+
+async def main(host, port):
+    server, escritor = await iniciar_servidor(host, port)
+    direccion = server.sockets[0].getsockname()
+    print(f"Servidor SMT escuchando en {direccion[0]}:{direccion[1]}")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await escritor.detener()
+        escritor.inventario.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Servidor multi-cliente del chatbot SMT")
+    parser.add_argument("--host", default=HOST)
+    parser.add_argument("--port", type=int, default=PORT)
+    args = parser.parse_args()
+    try:
+        asyncio.run(main(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,91 @@
+# -------------------------------
+# Prueba de estrés del libro de inventario
+# -------------------------------
+# Lanza varios procesos que retiran piezas al mismo tiempo sobre la misma
+# base SQLite y comprueba al final que:
+#   - ninguna existencia quedó negativa (no hubo sobreventa),
+#   - stock_inicial - sum(bitácora) == stock_final para cada pieza,
+#   - cada retiro confirmado por un proceso aparece en la bitácora.
+#
+# Uso: python stress_inventario.py [--procesos 8] [--retiros 2000]
+
+import argparse
+import multiprocessing as mp
+import os
+import random
+import sys
+import tempfile
+import time
+
+from inventario_db import Inventario, RETIRO_OK
+
+PIEZAS = 20
+STOCK_INICIAL = 2000
+
+
+def trabajador(filename, n_retiros, semilla, salida):
+    rnd = random.Random(semilla)
+    ok = 0
+    with Inventario(filename) as inv:
+        for _ in range(n_retiros):
+            pieza = f"pieza-{rnd.randrange(PIEZAS)}"
+            estado, _ = inv.retirar(pieza, rnd.randint(1, 5), f"tecnico-{semilla}")
+            if estado == RETIRO_OK:
+                ok += 1
+    salida.put(ok)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Prueba de estrés del libro de inventario (retiros concurrentes)")
+    parser.add_argument("--procesos", type=int, default=8)
+    parser.add_argument("--retiros", type=int, default=2000, help="retiros por proceso")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        filename = os.path.join(tmp, "stress.db")
+        inicial = {f"pieza-{i}": STOCK_INICIAL for i in range(PIEZAS)}
+        with Inventario(filename) as inv:
+            inv.sembrar(inicial)
+
+        salida = mp.Queue()
+        procesos = [
+            mp.Process(target=trabajador, args=(filename, args.retiros, semilla, salida))
+            for semilla in range(args.procesos)
+        ]
+        inicio = time.perf_counter()
+        for p in procesos:
+            p.start()
+        confirmados = sum(salida.get() for _ in procesos)
+        for p in procesos:
+            p.join()
+        duracion = time.perf_counter() - inicio
+
+        total = args.procesos * args.retiros
+        print(f"{total} retiros en {duracion:.2f}s ({total / duracion:.0f}/s), {confirmados} confirmados")
+
+        errores = []
+        with Inventario(filename) as inv:
+            final = inv.existencias()
+            retirado = dict.fromkeys(inicial, 0)
+            filas = 0
+            for pieza, cantidad, _, _ in inv.retiros():
+                retirado[pieza] += cantidad
+                filas += 1
+        for pieza, stock in final.items():
+            if stock < 0:
+                errores.append(f"{pieza}: stock negativo ({stock})")
+            if inicial[pieza] - retirado[pieza] != stock:
+                errores.append(f"{pieza}: {inicial[pieza]} - {retirado[pieza]} != {stock}")
+        if filas != confirmados:
+            errores.append(f"bitácora con {filas} filas, pero {confirmados} retiros confirmados")
+
+    if errores:
+        print("FALLO:")
+        for e in errores:
+            print(" -", e)
+        sys.exit(1)
+    print("OK: sin sobreventa y bitácora consistente")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+# Pruebas del libro de inventario (python -m pytest "Practica 2")
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from inventario_db import CANTIDAD_INVALIDA, NO_EXISTE, RETIRO_OK, Inventario, leer_retiros
+
+
+def test_importar_csv_con_marca_de_orden_de_bytes(tmp_path):
+    ruta = tmp_path / "existencias.csv"
+    ruta.write_bytes("pieza,cantidad\r\nnozzle,12\r\nrodillo,4\r\n".encode("utf-8-sig"))
+    with Inventario(str(tmp_path / "inventario.db")) as inv:
+        assert inv.importar(str(ruta)) == 2
+        assert inv.existencias() == {"nozzle": 12, "rodillo": 4}
+
+
+def test_reporte_del_lote_usa_la_linea_del_archivo(tmp_path):
+    ruta = tmp_path / "retiros.csv"
+    ruta.write_text("pieza,cantidad,quien\nnozzle,1,ana\n\nfantasma,1,luis\n\nnozzle,x,eva\n", encoding="utf-8")
+    with Inventario(str(tmp_path / "inventario.db")) as inv:
+        inv.sembrar({"nozzle": 10})
+        reporte = inv.retirar_lote(leer_retiros(str(ruta)))
+    assert [(numero, estado) for numero, _, _, estado, _ in reporte] == [
+        (2, RETIRO_OK), (4, NO_EXISTE), (6, CANTIDAD_INVALIDA)]
+
+
+def test_lote_sin_numeros_se_numera_desde_uno(tmp_path):
+    with Inventario(str(tmp_path / "inventario.db")) as inv:
+        inv.sembrar({"nozzle": 10})
+        reporte = inv.retirar_lote([("nozzle", 1, "ana"), ("nozzle", 2, "eva")])
+    assert [r[0] for r in reporte] == [1, 2]
+
+
+def test_retirar_cantidad_no_numerica(tmp_path):
+    with Inventario(str(tmp_path / "inventario.db")) as inv:
+        inv.sembrar({"nozzle": 10})
+        assert inv.retirar("nozzle", "x", "ana") == (CANTIDAD_INVALIDA, 10)
+        assert inv.retirar("nozzle", None, "ana") == (CANTIDAD_INVALIDA, 10)
+        assert inv.retirar("nozzle", "3", "ana") == (RETIRO_OK, 7)
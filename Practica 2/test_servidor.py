@@ -0,0 +1,63 @@
+# Pruebas del servidor multi-cliente (python -m pytest "Practica 2")
+
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from servidor import iniciar_servidor
+
+
+async def _turno(reader, writer, linea):
+    writer.write((linea + "\n").encode("utf-8"))
+    await writer.drain()
+    return await _hasta_indicacion(reader)
+
+
+async def _hasta_indicacion(reader):
+    lineas = []
+    while True:
+        linea = (await asyncio.wait_for(reader.readline(), 10)).decode("utf-8").rstrip("\n")
+        lineas.append(linea)
+        if linea.startswith("> ") or not linea:
+            return lineas
+
+
+def _sesion(ruta, pasos):
+    """Conecta un cliente, manda ``pasos`` y devuelve las respuestas de cada turno."""
+    async def correr():
+        server, escritor = await iniciar_servidor("127.0.0.1", 0, ruta)
+        port = server.sockets[0].getsockname()[1]
+        try:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            await _hasta_indicacion(reader)
+            respuestas = [await _turno(reader, writer, paso) for paso in pasos]
+            writer.close()
+            return respuestas, escritor
+        finally:
+            server.close()
+            await server.wait_closed()
+            await escritor.detener()
+            escritor.inventario.close()
+    return asyncio.run(correr())
+
+
+def test_digito_no_ascii_en_la_cantidad(tmp_path):
+    respuestas, _ = _sesion(str(tmp_path / "inventario.db"),
+                            ["xyz", "no", "nozzle", "²", "hola"])
+    assert respuestas[3] == ["Chatbot: Ingresa un número válido.", "> Tú:"]
+    assert respuestas[4][0].startswith("Chatbot: Hola!")
+
+
+def test_error_en_un_turno_no_cierra_la_sesion(tmp_path, monkeypatch):
+    from inventario_db import Inventario
+
+    def falla(self, pieza, cantidad, quien):
+        raise RuntimeError("base no disponible")
+    monkeypatch.setattr(Inventario, "retirar", falla)
+
+    respuestas, _ = _sesion(str(tmp_path / "inventario.db"),
+                            ["xyz", "no", "nozzle", "1", "ana", "hola"])
+    assert respuestas[4] == ["Chatbot: Ocurrió un error al procesar eso. Intenta de nuevo.", "> Tú:"]
+    assert respuestas[5][0].startswith("Chatbot: Hola!")
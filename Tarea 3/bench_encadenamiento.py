@@ -0,0 +1,94 @@
+# ==============================
+# BENCHMARK: encadenamiento hacia atrás con y sin tablas
+# ==============================
+# 1) Cadena en "diamante": cada nivel k tiene dos átomos, y cada uno se
+#    concluye de los dos átomos del nivel k-1 por dos reglas distintas. La
+#    última regla de cada átomo es la que funciona, así que sin tablas se
+#    re-deriva todo el nivel anterior una y otra vez (tiempo exponencial).
+# 2) Base grande: una cadena profunda (miles de niveles) dentro de muchas
+#    reglas de relleno, que sólo es manejable con tablas y pila explícita.
+# 3) Modus tollens sobre la cadena grande: se niega la meta final y se
+#    refutan hipótesis hacia atrás.
+#
+# Uso: python bench_encadenamiento.py [--max-ingenuo 10] [--profundidad 5000]
+
+import argparse
+import random
+import sys
+import time
+
+from encadenamiento_atras import ResolvedorAtras, probar_ingenuo
+
+
+def reglas_diamante(niveles):
+    reglas = []
+    for k in range(1, niveles + 1):
+        for lado in ("a", "b"):
+            meta = f"{lado}{k}"
+            # Primero una regla que falla al final (consulta todo el nivel anterior)
+            reglas.append({"condiciones": [f"a{k-1}", f"b{k-1}", "imposible"], "conclusion": meta})
+            reglas.append({"condiciones": [f"a{k-1}", f"b{k-1}"], "conclusion": meta})
+    hechos = {"a0": True, "b0": True}
+    return reglas, hechos, f"a{niveles}"
+
+
+def reglas_grandes(profundidad, relleno, rnd):
+    reglas = []
+    for k in range(1, profundidad + 1):
+        # Cada eslabón necesita el anterior y un síntoma lateral
+        reglas.append({"condiciones": [f"e{k-1}", f"s{k % 50}"], "conclusion": f"e{k}"})
+        reglas.append({"condiciones": [f"e{k-1}", "nunca"], "conclusion": f"e{k}"})
+    for i in range(relleno):
+        condiciones = [f"x{rnd.randrange(relleno)}" for _ in range(rnd.randint(1, 3))]
+        reglas.append({"condiciones": condiciones, "conclusion": f"x{rnd.randrange(relleno)}"})
+    hechos = {"e0": True}
+    hechos.update({f"s{i}": True for i in range(50)})
+    return reglas, hechos, f"e{profundidad}"
+
+
+def cronometrar(funcion):
+    inicio = time.perf_counter()
+    resultado = funcion()
+    return resultado, time.perf_counter() - inicio
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de encadenamiento hacia atrás")
+    parser.add_argument("--max-ingenuo", type=int, default=10, help="niveles máximos para la versión sin tablas")
+    parser.add_argument("--profundidad", type=int, default=5000)
+    parser.add_argument("--relleno", type=int, default=100_000)
+    args = parser.parse_args()
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 10_000))
+
+    print("Cadena en diamante (niveles, sin tablas vs con tablas):")
+    for niveles in range(4, args.max_ingenuo + 1, 2):
+        reglas, hechos, meta = reglas_diamante(niveles)
+        ok_i, t_i = cronometrar(lambda: probar_ingenuo(reglas, hechos, meta))
+        resolvedor = ResolvedorAtras(reglas, hechos)
+        ok_t, t_t = cronometrar(lambda: resolvedor.probar(meta))
+        assert ok_i and ok_t
+        print(f"  {niveles:3d} niveles: ingenuo {t_i * 1000:10.2f} ms   "
+              f"tablas {t_t * 1000:8.3f} ms ({resolvedor.expansiones} expansiones)")
+
+    reglas, hechos, meta = reglas_grandes(args.profundidad, args.relleno, random.Random(0))
+    resolvedor, t_c = cronometrar(lambda: ResolvedorAtras(reglas, hechos))
+    ok, t_p = cronometrar(lambda: resolvedor.probar(meta))
+    assert ok
+    print(f"Base de {len(reglas)} reglas, cadena de {args.profundidad} eslabones:")
+    print(f"  indexado {t_c * 1000:.1f} ms, prueba de {meta} {t_p * 1000:.1f} ms "
+          f"({resolvedor.expansiones} expansiones)")
+    _, t_2 = cronometrar(lambda: resolvedor.probar(meta))
+    print(f"  segunda consulta (tabla): {t_2 * 1e6:.1f} µs")
+
+    # Modus tollens: la meta final es falsa y el eslabón de partida es desconocido
+    hechos_t = {k: v for k, v in hechos.items() if k != "e0"}
+    hechos_t[meta] = False
+    resolvedor = ResolvedorAtras(reglas, hechos_t)
+    refutado, t_r = cronometrar(lambda: resolvedor.refutar("e0"))
+    assert refutado
+    print(f"  modus tollens: e0 refutado desde ¬{meta} en {t_r * 1000:.1f} ms "
+          f"({len(resolvedor.refutados())} hipótesis refutadas)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+# ==============================
+# ENCADENAMIENTO HACIA ATRÁS (dirigido por metas)
+# ==============================
+# Para probar una meta se buscan las reglas que la concluyen y se intenta
+# probar cada una de sus condiciones (modus ponens: si p y p -> q, entonces q).
+#
+# - Tabulación: cada submeta probada o fallida se guarda en una tabla, así en
+#   bases grandes una misma submeta no se vuelve a derivar (sin tabla, las
+#   cadenas que se ramifican y vuelven a juntarse cuestan tiempo exponencial).
+# - Ciclos: una submeta que ya está en la pila se trata como no probada en
+#   ese camino. Los fallos que dependen de una meta todavía en curso no se
+#   tabulan hasta que esa meta (la "líder" del ciclo) termina.
+# - La búsqueda usa una pila explícita, no recursión de Python, así que las
+#   cadenas de miles de reglas no chocan con el límite de recursión.
+# - Modus tollens: si q es falso y p1 y ... y pn -> q, entonces no todas las
+#   pi son ciertas; si las demás condiciones están probadas, la restante queda
+#   refutada. refutar(h) usa esto a partir de los hechos marcados como False.
+#
+# Formato de reglas:  {"condiciones": ["p", "r"], "conclusion": "q"}
+# Formato de hechos:  {"p": True, "q": False}   (lo que no aparece es desconocido)
+
+
+class _Marco:
+    __slots__ = ("meta", "reglas", "ri", "ci", "bajo", "profundidad")
+
+    def __init__(self, meta, reglas, profundidad):
+        self.meta = meta
+        self.reglas = reglas
+        self.ri = 0
+        self.ci = 0
+        self.bajo = profundidad
+        self.profundidad = profundidad
+
+
+class ResolvedorAtras:
+    def __init__(self, reglas, hechos=None):
+        self.reglas = [(tuple(r["condiciones"]), r["conclusion"]) for r in reglas]
+        self.por_conclusion = {}
+        for regla_id, (_, conclusion) in enumerate(self.reglas):
+            self.por_conclusion.setdefault(conclusion, []).append(regla_id)
+        self.hechos = dict(hechos or {})
+        self.limpiar_tablas()
+
+    def limpiar_tablas(self):
+        self.probados = set()
+        self.fallidos = set()
+        self._refutados = None
+        self.expansiones = 0   # metas realmente exploradas (para los benchmarks)
+
+    def afirmar(self, hecho, valor=True):
+        """Cambia un hecho; las tablas dejan de ser válidas y se vacían."""
+        self.hechos[hecho] = valor
+        self.limpiar_tablas()
+
+    # ----------------- Modus ponens -----------------
+    def _conocido(self, meta):
+        valor = self.hechos.get(meta)
+        if valor is not None:
+            return valor
+        if meta in self.probados:
+            return True
+        if meta in self.fallidos:
+            return False
+        return None
+
+    def probar(self, meta):
+        """True si la meta se deriva de los hechos y las reglas."""
+        valor = self._conocido(meta)
+        if valor is not None:
+            return valor
+
+        en_curso = {meta: 0}
+        pila = [_Marco(meta, self.por_conclusion.get(meta, ()), 0)]
+        pendientes = []   # (meta, profundidad) de fallos aún sin tabular
+        self.expansiones += 1
+        resultado = None  # resultado del último marco terminado
+
+        while pila:
+            m = pila[-1]
+
+            if resultado is not None:
+                # Regresa el resultado de la submeta m.reglas[m.ri][m.ci]
+                if resultado:
+                    m.ci += 1
+                else:
+                    m.ri += 1
+                    m.ci = 0
+                resultado = None
+
+            terminado = None
+            while terminado is None:
+                if m.ri >= len(m.reglas):
+                    terminado = False
+                    break
+                condiciones = self.reglas[m.reglas[m.ri]][0]
+                if m.ci >= len(condiciones):
+                    terminado = True
+                    break
+                condicion = condiciones[m.ci]
+                valor = self._conocido(condicion)
+                if valor is None and condicion in en_curso:
+                    # Ciclo: en este camino no se puede usar la meta pendiente
+                    m.bajo = min(m.bajo, en_curso[condicion])
+                    valor = False
+                if valor is None:
+                    hijo = _Marco(condicion, self.por_conclusion.get(condicion, ()), len(pila))
+                    en_curso[condicion] = hijo.profundidad
+                    pila.append(hijo)
+                    self.expansiones += 1
+                    break
+                if valor:
+                    m.ci += 1
+                else:
+                    m.ri += 1
+                    m.ci = 0
+
+            if terminado is None:
+                continue   # se apiló una submeta
+
+            pila.pop()
+            del en_curso[m.meta]
+            # Los fallos pendientes que surgieron mientras m estaba en curso
+            # son los del final de la lista (profundidad mayor que la de m).
+            debajo = []
+            while pendientes and pendientes[-1][1] > m.profundidad:
+                debajo.append(pendientes.pop()[0])
+            if terminado:
+                # Los fallos de abajo pudieron suponer que esta meta era falsa:
+                # se descartan sin tabular.
+                self.probados.add(m.meta)
+            elif m.bajo >= m.profundidad:
+                # Líder de su ciclo (o sin ciclo): su fallo y los de abajo son definitivos
+                self.fallidos.add(m.meta)
+                self.fallidos.update(debajo)
+            else:
+                # Depende de una meta que sigue en curso: queda pendiente al nivel de m
+                for meta in debajo:
+                    pendientes.append((meta, m.profundidad))
+                pendientes.append((m.meta, m.profundidad))
+                pila[-1].bajo = min(pila[-1].bajo, m.bajo)
+            resultado = terminado
+
+        return resultado
+
+    # ----------------- Modus tollens -----------------
+    def refutar(self, hipotesis):
+        """True si la hipótesis queda refutada por modus tollens.
+
+        Parte de los hechos marcados como False y recorre las reglas hacia
+        atrás: si la conclusión de una regla es falsa y todas sus condiciones
+        menos una están probadas, esa condición es falsa. El resultado se
+        calcula una vez y queda en tabla hasta que cambien los hechos.
+        """
+        if self._refutados is None:
+            self._refutados = self._calcular_refutados()
+        return hipotesis in self._refutados
+
+    def refutados(self):
+        if self._refutados is None:
+            self._refutados = self._calcular_refutados()
+        return set(self._refutados)
+
+    def _calcular_refutados(self):
+        refutados = {h for h, v in self.hechos.items() if v is False}
+        pendientes = list(refutados)
+        while pendientes:
+            falso = pendientes.pop()
+            for regla_id in self.por_conclusion.get(falso, ()):
+                condiciones = self.reglas[regla_id][0]
+                sin_probar = [c for c in condiciones if not self.probar(c)]
+                if len(sin_probar) == 1 and sin_probar[0] not in refutados:
+                    refutados.add(sin_probar[0])
+                    pendientes.append(sin_probar[0])
+        return refutados
+
+
+# ==============================
+# REFERENCIA SIN TABLAS (para los benchmarks)
+# ==============================
+def probar_ingenuo(reglas, hechos, meta, _camino=None):
+    """Encadenamiento hacia atrás recursivo sin memoria: re-deriva todo."""
+    if meta in hechos:
+        return hechos[meta]
+    camino = _camino or set()
+    if meta in camino:
+        return False
+    camino.add(meta)
+    try:
+        for regla in reglas:
+            if regla["conclusion"] == meta and all(
+                probar_ingenuo(reglas, hechos, c, camino) for c in regla["condiciones"]
+            ):
+                return True
+        return False
+    finally:
+        camino.discard(meta)
+
+
+if __name__ == "__main__":
+    reglas = [
+        {"condiciones": ["llueve"], "conclusion": "suelo_mojado"},
+        {"condiciones": ["suelo_mojado", "frio"], "conclusion": "hielo"},
+        {"condiciones": ["aspersor"], "conclusion": "suelo_mojado"},
+    ]
+    hechos = {"llueve": True, "frio": True, "aspersor": False}
+    r = ResolvedorAtras(reglas, hechos)
+    print("Modus ponens, ¿hielo?:", r.probar("hielo"))
+
+    # Modus tollens: no hay hielo y hace frío -> el suelo no está mojado -> no llueve
+    r = ResolvedorAtras(reglas, {"frio": True, "hielo": False})
+    print("Modus tollens, refutados:", sorted(r.refutados()))
@@ -0,0 +1,94 @@
+# ==============================
+# BENCHMARK: recuperación de casos con LSH vs. recorrido completo
+# ==============================
+# Genera casos agrupados alrededor de prototipos (pacientes parecidos con
+# algunos síntomas cambiados), los guarda en una biblioteca temporal y compara
+# vecinos() con LSH contra vecinos(exacto=True): tiempo por consulta y
+# cuántos de los k vecinos exactos encuentra LSH (recall), contra el objetivo
+# RECALL_OBJETIVO (sale con código 1 si no se alcanza).
+#
+# Uso: python bench_casos.py [--casos 100000] [--consultas 50] [--k 5]
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+from casos import BANDAS, FILAS, BibliotecaCasos
+
+RECALL_OBJETIVO = 0.99
+
+
+def generar_casos(n, rnd, n_sintomas=500, n_prototipos=None, tamano=12, ruido=2):
+    """Casos (hechos, resultado) derivados de prototipos con ``ruido`` síntomas cambiados."""
+    n_prototipos = n_prototipos or max(10, n // 50)
+    prototipos = [rnd.sample(range(n_sintomas), tamano) for _ in range(n_prototipos)]
+    for _ in range(n):
+        p = rnd.randrange(n_prototipos)
+        yield variar(prototipos[p], rnd, n_sintomas, ruido), [f"diagnostico_{p}"]
+
+
+def variar(prototipo, rnd, n_sintomas, ruido):
+    sintomas = set(prototipo)
+    for s in rnd.sample(prototipo, ruido):
+        sintomas.discard(s)
+        sintomas.add(rnd.randrange(n_sintomas))
+    return {f"s{s}": True for s in sintomas}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de la biblioteca de casos")
+    parser.add_argument("--casos", type=int, default=100_000)
+    parser.add_argument("--consultas", type=int, default=50)
+    parser.add_argument("--k", type=int, default=5)
+    args = parser.parse_args()
+
+    rnd = random.Random(0)
+    casos = list(generar_casos(args.casos, rnd))
+    consultas = [rnd.choice(casos)[0] for _ in range(args.consultas)]
+    # Variar las consultas para que no sean casos idénticos a los guardados
+    consultas = [variar([int(h[1:]) for h in c], rnd, 500, 1) for c in consultas]
+
+    with tempfile.TemporaryDirectory() as tmp, BibliotecaCasos(os.path.join(tmp, "casos.db")) as biblioteca:
+        inicio = time.perf_counter()
+        for i in range(0, len(casos), 10_000):
+            biblioteca.aprender_varios(casos[i:i + 10_000])
+        t = time.perf_counter() - inicio
+        print(f"{len(casos)} casos aprendidos en {t:.1f} s ({len(casos) / t:,.0f} casos/s)")
+
+        inicio = time.perf_counter()
+        exactos = [biblioteca.vecinos(c, k=args.k, exacto=True) for c in consultas]
+        t_exacto = (time.perf_counter() - inicio) / len(consultas)
+        inicio = time.perf_counter()
+        aproximados = [biblioteca.vecinos(c, k=args.k) for c in consultas]
+        t_lsh = (time.perf_counter() - inicio) / len(consultas)
+
+        # Recall por similitud: cuenta como acierto cualquier caso tan
+        # parecido como el k-ésimo exacto (hay empates entre casos iguales)
+        aciertos = total = 0
+        for exacto, aproximado in zip(exactos, aproximados):
+            if not exacto:
+                continue
+            corte = exacto[-1][0]
+            aciertos += min(len(exacto), sum(1 for s, _, _ in aproximado if s >= corte))
+            total += len(exacto)
+        mismo_top1 = sum(1 for e, a in zip(exactos, aproximados) if e and a and a[0][0] == e[0][0])
+
+        print(f"  exacto: {t_exacto * 1000:8.2f} ms por consulta")
+        print(f"  LSH:    {t_lsh * 1000:8.2f} ms por consulta  ({t_exacto / t_lsh:.0f}x)")
+        recall = aciertos / total
+        print(f"  recall@{args.k}: {recall:.3f} (objetivo {RECALL_OBJETIVO}, {BANDAS} bandas x {FILAS} filas: "
+              f"{'cumple' if recall >= RECALL_OBJETIVO else 'NO cumple'})   "
+              f"mismo mejor vecino: {mismo_top1}/{len(consultas)}")
+
+        inicio = time.perf_counter()
+        quitados = biblioteca.podar(max_casos=len(casos) // 2)
+        print(f"  podar(max_casos={len(casos) // 2}): {quitados} casos quitados en "
+              f"{time.perf_counter() - inicio:.2f} s, quedan {len(biblioteca)}")
+    return 0 if recall >= RECALL_OBJETIVO else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
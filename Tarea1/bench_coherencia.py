@@ -0,0 +1,102 @@
+# ==============================
+# BENCHMARK: control de coherencia indexado vs. comparación por pares
+# ==============================
+# Genera bases de reglas con duplicados, subsumidas y contradicciones
+# sembradas. Compara el verificador indexado con una revisión ingenua que
+# compara cada par de reglas, y revisa que ambos encuentren lo mismo.
+#
+# Uso: python bench_coherencia.py [--tamanos 1000 2000 4000] [--grande 100000]
+
+import argparse
+import random
+import time
+
+from coherencia import VerificadorCoherencia, negar
+
+
+def generar_reglas(n, rnd, n_sintomas=400, n_conclusiones=None):
+    n_conclusiones = n_conclusiones or max(10, n // 20)
+    reglas = []
+    for _ in range(n):
+        r = rnd.random()
+        if reglas and r < 0.05:
+            base = rnd.choice(reglas)
+            reglas.append({"condiciones": list(reversed(base["condiciones"])), "conclusion": base["conclusion"]})
+        elif reglas and r < 0.10:
+            base = rnd.choice(reglas)
+            reglas.append({"condiciones": base["condiciones"] + [f"s{rnd.randrange(n_sintomas)}"],
+                           "conclusion": base["conclusion"]})
+        elif reglas and r < 0.12:
+            base = rnd.choice(reglas)
+            reglas.append({"condiciones": list(base["condiciones"]), "conclusion": negar(base["conclusion"])})
+        else:
+            reglas.append({"condiciones": [f"s{rnd.randrange(n_sintomas)}" for _ in range(rnd.randint(1, 4))],
+                           "conclusion": f"c{rnd.randrange(n_conclusiones)}"})
+    return reglas
+
+
+def por_pares(reglas):
+    """Revisión ingenua O(n²): cuenta pares duplicados, subsumidos y contradictorios."""
+    conjuntos = [(frozenset(r["condiciones"]), r["conclusion"]) for r in reglas]
+    conteo = {"duplicada": 0, "subsumida": 0, "contradictoria": 0}
+    for j, (cj, xj) in enumerate(conjuntos):
+        duplicada = False
+        for i in range(j):
+            ci, xi = conjuntos[i]
+            if xi == xj and ci == cj:
+                duplicada = True
+            elif xi == negar(xj) and (ci <= cj or cj <= ci):
+                conteo["contradictoria"] += 1
+        if duplicada:
+            # Igual que el verificador: una duplicada se reporta una vez y no
+            # se vuelve a comparar como subsumida
+            conteo["duplicada"] += 1
+            continue
+        for i in range(j):
+            ci, xi = conjuntos[i]
+            if xi == xj and ci != cj and (ci <= cj or cj <= ci):
+                conteo["subsumida"] += 1
+    return conteo
+
+
+def contar(hallazgos):
+    conteo = {"duplicada": 0, "subsumida": 0, "contradictoria": 0}
+    for h in hallazgos:
+        if h.tipo in conteo:
+            conteo[h.tipo] += 1
+    return conteo
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark del control de coherencia")
+    parser.add_argument("--tamanos", type=int, nargs="+", default=[1000, 2000, 4000])
+    parser.add_argument("--grande", type=int, default=100_000)
+    args = parser.parse_args()
+
+    rnd = random.Random(0)
+    for n in args.tamanos:
+        reglas = generar_reglas(n, rnd)
+        inicio = time.perf_counter()
+        esperado = por_pares(reglas)
+        t_pares = time.perf_counter() - inicio
+        inicio = time.perf_counter()
+        obtenido = contar(VerificadorCoherencia(reglas).hallazgos())
+        t_indice = time.perf_counter() - inicio
+        if obtenido != esperado:
+            raise SystemExit(f"Diferencia con n={n}: {obtenido} != {esperado}")
+        print(f"{n:7d} reglas: por pares {t_pares * 1000:9.1f} ms   indexado {t_indice * 1000:7.1f} ms   {obtenido}")
+
+    reglas = generar_reglas(args.grande, rnd, n_sintomas=5000)
+    inicio = time.perf_counter()
+    verificador = VerificadorCoherencia(reglas)
+    hallazgos = verificador.hallazgos()
+    t = time.perf_counter() - inicio
+    print(f"{args.grande:7d} reglas: indexado {t:.2f} s, {len(hallazgos)} hallazgos")
+
+    inicio = time.perf_counter()
+    verificador.agregar_regla(["s1", "s2"], "c1")
+    print(f"  agregar_regla incremental: {(time.perf_counter() - inicio) * 1e6:.0f} µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+# ==============================
+# BENCHMARK: costo de la traza de explicación
+# ==============================
+# Misma base de reglas que bench_motor.py. Se hacen consultas desde cero con
+# explicar=False y con explicar=True y se compara el tiempo. También se mide
+# cuánta memoria ocupa la traza y que respete el límite de derivaciones.
+#
+# Uso: python bench_explicacion.py [--reglas 10000] [--consultas 50]
+
+import argparse
+import random
+import time
+
+from bench_motor import generar_reglas
+from motor_inferencia import MotorRete
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark del subsistema de explicación")
+    parser.add_argument("--reglas", type=int, default=10_000)
+    parser.add_argument("--sintomas", type=int, default=60)
+    parser.add_argument("--consultas", type=int, default=50)
+    parser.add_argument("--limite", type=int, default=200, help="max_derivaciones para la prueba de límite")
+    args = parser.parse_args()
+
+    rnd = random.Random(0)
+    sintomas, reglas = generar_reglas(args.reglas, args.sintomas, 4, rnd)
+    motor = MotorRete(reglas)
+    consultas = [{s: True for s in rnd.sample(sintomas, len(sintomas) // 2)} for _ in range(args.consultas)]
+
+    def correr(explicar, max_derivaciones=None):
+        trazas = []
+        inicio = time.perf_counter()
+        for hechos in consultas:
+            _, traza = motor.consultar(hechos, explicar=explicar, max_derivaciones=max_derivaciones)
+            trazas.append(traza)
+        return (time.perf_counter() - inicio) / len(consultas), trazas
+
+    correr(False)  # calentamiento
+    t_sin, _ = correr(False)
+    t_con, trazas = correr(True)
+    t_sin2, _ = correr(False)
+    t_sin = min(t_sin, t_sin2)
+
+    derivaciones = sum(len(t) for t in trazas) / len(trazas)
+    memoria = sum(t.bytes() for t in trazas) / len(trazas)
+    print(f"{len(reglas)} reglas, {len(consultas)} consultas")
+    print(f"  explicar=False: {t_sin * 1000:8.2f} ms por consulta")
+    print(f"  explicar=True:  {t_con * 1000:8.2f} ms por consulta  (+{100 * (t_con / t_sin - 1):.0f}%)")
+    print(f"  traza: {derivaciones:.0f} derivaciones, {memoria / 1024:.0f} KiB en arreglos "
+          f"({memoria / max(derivaciones, 1):.1f} bytes por derivación)")
+
+    _, trazas = correr(True, max_derivaciones=args.limite)
+    assert all(len(t) <= args.limite for t in trazas)
+    print(f"  con max_derivaciones={args.limite}: máx. {max(len(t) for t in trazas)} derivaciones, "
+          f"{sum(t.truncada for t in trazas)} trazas truncadas")
+
+    # Explicación perezosa de una conclusión profunda
+    diagnostico, traza = motor.consultar(consultas[0], explicar=True)
+    profunda = max(diagnostico, key=lambda c: c.split("_")[0])
+    inicio = time.perf_counter()
+    lineas = traza.explicar(profunda)
+    print(f"  explicar({profunda!r}): {len(lineas)} líneas en {(time.perf_counter() - inicio) * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+# ==============================
+# BENCHMARK: motor Rete vs. ciclo ingenuo
+# ==============================
+# Genera una base de N reglas (por defecto 10,000) en capas: las reglas de la
+# primera capa usan síntomas, las siguientes usan también conclusiones de
+# capas anteriores, así hay encadenamiento. Luego aplica un flujo de cambios
+# de hechos (afirmar/retractar) y compara:
+#   - ingenuo: inferir_ingenuo() completo después de cada cambio,
+#   - Rete: sólo la propagación incremental del cambio.
+# Se verifica que ambos lleguen a los mismos hechos.
+#
+# Uso: python bench_motor.py [--reglas 10000] [--cambios 200] [--semilla 0]
+
+import argparse
+import random
+import time
+
+from motor_inferencia import MotorRete, inferir_ingenuo
+
+
+def generar_reglas(n_reglas, n_sintomas, capas, rnd):
+    sintomas = [f"s{i}" for i in range(n_sintomas)]
+    reglas = []
+    disponibles = list(sintomas)
+    por_capa = n_reglas // capas
+    for capa in range(capas):
+        nuevas = []
+        for i in range(por_capa if capa < capas - 1 else n_reglas - len(reglas)):
+            condiciones = rnd.sample(disponibles, rnd.randint(2, 5))
+            conclusion = f"c{capa}_{i % (por_capa // 4 + 1)}"
+            reglas.append({"condiciones": condiciones, "conclusion": conclusion})
+            nuevas.append(conclusion)
+        disponibles = disponibles + sorted(set(nuevas))
+    return sintomas, reglas
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark del motor de inferencia")
+    parser.add_argument("--reglas", type=int, default=10_000)
+    parser.add_argument("--sintomas", type=int, default=60)
+    parser.add_argument("--capas", type=int, default=4)
+    parser.add_argument("--cambios", type=int, default=200)
+    parser.add_argument("--semilla", type=int, default=0)
+    args = parser.parse_args()
+
+    rnd = random.Random(args.semilla)
+    sintomas, reglas = generar_reglas(args.reglas, args.sintomas, args.capas, rnd)
+    total_condiciones = sum(len(r["condiciones"]) for r in reglas)
+
+    inicio = time.perf_counter()
+    motor = MotorRete(reglas)
+    compilacion = time.perf_counter() - inicio
+    print(f"{len(reglas)} reglas, {total_condiciones} condiciones -> {motor.num_nodos()} nodos "
+          f"({100 * (1 - motor.num_nodos() / total_condiciones):.0f}% compartido), "
+          f"compilación {compilacion:.2f}s")
+
+    # Flujo de cambios: empieza con la mitad de los síntomas presentes
+    base = set(rnd.sample(sintomas, len(sintomas) // 2))
+    for hecho in base:
+        motor.afirmar(hecho)
+    cambios = [rnd.choice(sintomas) for _ in range(args.cambios)]
+
+    t_rete = t_ingenuo = 0.0
+    for hecho in cambios:
+        inicio = time.perf_counter()
+        if hecho in base:
+            motor.retractar(hecho)
+        else:
+            motor.afirmar(hecho)
+        t_rete += time.perf_counter() - inicio
+
+        if hecho in base:
+            base.remove(hecho)
+        else:
+            base.add(hecho)
+        inicio = time.perf_counter()
+        esperado = inferir_ingenuo(reglas, base)
+        t_ingenuo += time.perf_counter() - inicio
+
+        if motor.hechos() != esperado:
+            raise SystemExit(f"Diferencia de resultados tras cambiar {hecho!r}")
+
+    n = len(cambios)
+    print(f"{n} cambios de hechos, {len(motor.conclusiones())} conclusiones al final")
+    print(f"  ingenuo: {t_ingenuo * 1000 / n:8.3f} ms por cambio")
+    print(f"  Rete:    {t_rete * 1000 / n:8.3f} ms por cambio  ({t_ingenuo / max(t_rete, 1e-9):.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,344 @@
+# ==============================
+# SUBSISTEMA DE APRENDIZAJE: BIBLIOTECA DE CASOS
+# ==============================
+# Implementa el componente 10 de arquitectura_sistema_experto.md. En lugar de
+# una lista en memoria que nadie consulta, cada caso aprendido (hechos +
+# resultado) se guarda en SQLite y se puede recuperar por parecido:
+#
+# - Los hechos verdaderos de un caso se codifican como un vector binario
+#   (un bit por hecho del vocabulario, guardado como entero).
+# - La similitud es Jaccard (bits en común / bits en total); la distancia de
+#   Hamming es el número de bits distintos. Los hechos de una consulta que
+#   aún no están en el vocabulario no tienen bit, pero sí cuentan en el total.
+# - Para no comparar contra todos los casos, cada caso lleva una firma
+#   MinHash dividida en bandas (LSH). Sólo los casos que coinciden en alguna
+#   banda son candidatos y a esos se les calcula la similitud exacta.
+# - podar() quita casos viejos o poco usados para acotar el tamaño.
+#
+# inferir_con_casos() consulta primero la biblioteca y sólo corre el motor de
+# reglas completo si no hay un caso suficientemente parecido.
+
+import hashlib
+import json
+import os
+import random
+import sqlite3
+import time
+
+CASOS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "casos.db")
+
+# Con 24 bandas de 3 filas un caso con similitud s es candidato con
+# probabilidad 1 - (1 - s^3)^24: 0.96 para s = 0.5 y 0.9999 para s = 0.7
+# (bench_casos.py: recall@5 >= 0.99 con 100 000 casos).
+BANDAS = 24
+FILAS = 3                 # valores MinHash por banda
+PRIMO = (1 << 61) - 1
+MAX_CANDIDATOS = 2_000    # tope de candidatos por consulta (cubetas muy pobladas)
+USOS_PENDIENTES = 1_000   # usos acumulados en memoria antes de escribirlos
+VERSION_LSH = 2           # PRAGMA user_version: cómo se calculan las claves de lsh (y BANDAS x FILAS)
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS vocabulario (
+    hecho TEXT PRIMARY KEY,
+    bit   INTEGER NOT NULL UNIQUE
+);
+
+CREATE TABLE IF NOT EXISTS casos (
+    id        INTEGER PRIMARY KEY,
+    bits      BLOB NOT NULL,
+    resultado TEXT NOT NULL,
+    creado    REAL NOT NULL,
+    usado     REAL NOT NULL,
+    usos      INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS casos_creado ON casos (creado);
+
+CREATE TABLE IF NOT EXISTS lsh (
+    banda INTEGER NOT NULL,
+    clave INTEGER NOT NULL,
+    caso  INTEGER NOT NULL,
+    PRIMARY KEY (banda, clave, caso)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS lsh_caso ON lsh (caso);
+"""
+
+
+def jaccard(a, b, extra=0):
+    """Jaccard entre dos vectores; ``extra`` son elementos que sólo están en uno
+    de los dos y no tienen bit (hechos fuera del vocabulario)."""
+    union = (a | b).bit_count() + extra
+    return 1.0 if union == 0 else (a & b).bit_count() / union
+
+
+def hamming(a, b):
+    return (a ^ b).bit_count()
+
+
+class BibliotecaCasos:
+    def __init__(self, filename=CASOS_FILE, semilla=0):
+        self.conn = sqlite3.connect(filename, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(ESQUEMA)
+        self.vocabulario = dict(self.conn.execute("SELECT hecho, bit FROM vocabulario"))
+        # Funciones hash h(x) = (a*x + b) mod PRIMO; la semilla fija las
+        # mismas funciones entre ejecuciones (las firmas guardadas siguen valiendo).
+        rnd = random.Random(semilla)
+        self._coef = [(rnd.randrange(1, PRIMO), rnd.randrange(PRIMO)) for _ in range(BANDAS * FILAS)]
+        self._hash_bit = {}   # bit -> tupla con sus BANDAS*FILAS valores hash
+        # Consultar no escribe: los usos se acumulan aquí (id -> [usado, usos])
+        # y se guardan juntos en una transacción (guardar_usos, podar, close).
+        self._usos = {}
+        if self.conn.execute("PRAGMA user_version").fetchone()[0] < VERSION_LSH:
+            self._reindexar()
+
+    def close(self):
+        self.guardar_usos()
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return self.conn.execute("SELECT COUNT(*) FROM casos").fetchone()[0]
+
+    # ----------------- Codificación -----------------
+    def _bits(self, hechos, crear):
+        """(posiciones de bit de los hechos verdaderos, cuántos no tienen bit).
+
+        Con ``crear`` se agregan al vocabulario los que falten."""
+        verdaderos = [h for h, v in hechos.items() if v] if isinstance(hechos, dict) else list(hechos)
+        posiciones = []
+        desconocidos = 0
+        for hecho in verdaderos:
+            bit = self.vocabulario.get(hecho)
+            if bit is None:
+                if not crear:
+                    desconocidos += 1
+                    continue
+                bit = len(self.vocabulario)
+                self.conn.execute("INSERT INTO vocabulario (hecho, bit) VALUES (?, ?)", (hecho, bit))
+                self.vocabulario[hecho] = bit
+            posiciones.append(bit)
+        return posiciones, desconocidos
+
+    def codificar(self, hechos):
+        """Vector binario (entero) de un diccionario de hechos."""
+        vector = 0
+        for bit in self._bits(hechos, crear=False)[0]:
+            vector |= 1 << bit
+        return vector
+
+    def _valores_hash(self, bit):
+        valores = self._hash_bit.get(bit)
+        if valores is None:
+            valores = self._hash_bit[bit] = tuple((a * bit + b) % PRIMO for a, b in self._coef)
+        return valores
+
+    def _claves_lsh(self, posiciones):
+        if posiciones:
+            firma = list(map(min, zip(*(self._valores_hash(b) for b in posiciones))))
+        else:
+            firma = [PRIMO] * (BANDAS * FILAS)
+        # La clave de una banda es un resumen blake2b de sus FILAS valores: no
+        # depende de la versión de Python ni de la plataforma (hash() sí).
+        claves = []
+        for i in range(BANDAS):
+            banda = b"".join(v.to_bytes(8, "little") for v in firma[i * FILAS:(i + 1) * FILAS])
+            claves.append(int.from_bytes(hashlib.blake2b(banda, digest_size=8).digest(), "little", signed=True))
+        return claves
+
+    def _reindexar(self):
+        """Recalcula la tabla lsh (bases creadas con claves de otra versión)."""
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            self.conn.execute("DELETE FROM lsh")
+            filas_lsh = []
+            for caso_id, bits in self.conn.execute("SELECT id, bits FROM casos").fetchall():
+                vector = _de_bytes(bits)
+                posiciones = [b for b in range(vector.bit_length()) if vector >> b & 1]
+                filas_lsh.extend((banda, clave, caso_id) for banda, clave in enumerate(self._claves_lsh(posiciones)))
+            filas_lsh.sort()
+            self.conn.executemany("INSERT OR IGNORE INTO lsh (banda, clave, caso) VALUES (?, ?, ?)", filas_lsh)
+            self.conn.execute(f"PRAGMA user_version = {VERSION_LSH}")
+            self.conn.execute("COMMIT")
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+
+    # ----------------- Aprender -----------------
+    def aprender(self, caso, resultado, ahora=None):
+        """Guarda un caso (hechos -> resultado); devuelve su id."""
+        return self.aprender_varios([(caso, resultado)], ahora)[0]
+
+    def aprender_varios(self, casos, ahora=None):
+        """Guarda muchos casos en una sola transacción."""
+        ahora = time.time() if ahora is None else ahora
+        ids = []
+        filas_lsh = []
+        self.conn.execute("BEGIN")
+        try:
+            for caso, resultado in casos:
+                posiciones, _ = self._bits(caso, crear=True)
+                vector = 0
+                for bit in posiciones:
+                    vector |= 1 << bit
+                cur = self.conn.execute(
+                    "INSERT INTO casos (bits, resultado, creado, usado) VALUES (?, ?, ?, ?)",
+                    (_a_bytes(vector), json.dumps(resultado, ensure_ascii=False), ahora, ahora),
+                )
+                caso_id = cur.lastrowid
+                filas_lsh.extend((banda, clave, caso_id) for banda, clave in enumerate(self._claves_lsh(posiciones)))
+                ids.append(caso_id)
+            # Ordenadas por (banda, clave) las inserciones en el índice son casi secuenciales
+            filas_lsh.sort()
+            self.conn.executemany("INSERT OR IGNORE INTO lsh (banda, clave, caso) VALUES (?, ?, ?)", filas_lsh)
+            self.conn.execute("COMMIT")
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            # El vocabulario en memoria pudo quedar adelantado al de la base
+            self.vocabulario = dict(self.conn.execute("SELECT hecho, bit FROM vocabulario"))
+            raise
+        return ids
+
+    # ----------------- Consultar -----------------
+    def vecinos(self, hechos, k=5, exacto=False, ahora=None):
+        """Los ``k`` casos más parecidos: lista de (similitud, id, resultado).
+
+        Con exacto=False sólo se comparan los candidatos de LSH (sublineal,
+        aproximado); con exacto=True se recorre toda la biblioteca.
+        """
+        posiciones, desconocidos = self._bits(hechos, crear=False)
+        vector = 0
+        for bit in posiciones:
+            vector |= 1 << bit
+
+        if exacto:
+            filas = self.conn.execute("SELECT id, bits, resultado FROM casos")
+        else:
+            candidatos = set()
+            for banda, clave in enumerate(self._claves_lsh(posiciones)):
+                candidatos.update(c for (c,) in self.conn.execute(
+                    "SELECT caso FROM lsh WHERE banda = ? AND clave = ? LIMIT ?",
+                    (banda, clave, MAX_CANDIDATOS),
+                ))
+                if len(candidatos) >= MAX_CANDIDATOS:
+                    break
+            if not candidatos:
+                return []
+            marcas = ",".join("?" * len(candidatos))
+            filas = self.conn.execute(f"SELECT id, bits, resultado FROM casos WHERE id IN ({marcas})", list(candidatos))
+
+        puntuados = []
+        for caso_id, bits, resultado in filas:
+            puntuados.append((jaccard(vector, _de_bytes(bits), desconocidos), caso_id, resultado))
+        puntuados.sort(key=lambda x: (-x[0], x[1]))
+        mejores = [(s, i, json.loads(r)) for s, i, r in puntuados[:k]]
+
+        if mejores:
+            ahora = time.time() if ahora is None else ahora
+            for _, caso_id, _ in mejores:
+                uso = self._usos.setdefault(caso_id, [ahora, 0])
+                uso[0] = max(uso[0], ahora)
+                uso[1] += 1
+            if len(self._usos) >= USOS_PENDIENTES:
+                self.guardar_usos()
+        return mejores
+
+    def guardar_usos(self):
+        """Escribe los usos acumulados por vecinos() en una sola transacción."""
+        if not self._usos:
+            return
+        filas = [(usado, usos, caso_id) for caso_id, (usado, usos) in self._usos.items()]
+        self.conn.execute("BEGIN")
+        try:
+            self.conn.executemany("UPDATE casos SET usado = max(usado, ?), usos = usos + ? WHERE id = ?", filas)
+            self.conn.execute("COMMIT")
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        self._usos.clear()
+
+    # ----------------- Desalojo -----------------
+    def podar(self, max_edad=None, max_casos=None, ahora=None):
+        """Quita casos creados hace más de ``max_edad`` segundos y, si aún
+        sobran más de ``max_casos``, los menos usados (y usados hace más
+        tiempo). Devuelve cuántos se quitaron."""
+        ahora = time.time() if ahora is None else ahora
+        self.guardar_usos()   # el orden por usos/usado debe ver los pendientes
+        antes = len(self)
+        self.conn.execute("BEGIN")
+        try:
+            if max_edad is not None:
+                self.conn.execute("CREATE TEMP TABLE IF NOT EXISTS _podar (id INTEGER PRIMARY KEY)")
+                self.conn.execute("DELETE FROM _podar")
+                self.conn.execute("INSERT INTO _podar SELECT id FROM casos WHERE creado < ?", (ahora - max_edad,))
+                self._borrar_marcados()
+            if max_casos is not None:
+                self.conn.execute("CREATE TEMP TABLE IF NOT EXISTS _podar (id INTEGER PRIMARY KEY)")
+                self.conn.execute("DELETE FROM _podar")
+                self.conn.execute(
+                    "INSERT INTO _podar SELECT id FROM casos ORDER BY usos ASC, usado ASC "
+                    "LIMIT max(0, (SELECT COUNT(*) FROM casos) - ?)",
+                    (max_casos,),
+                )
+                self._borrar_marcados()
+            self.conn.execute("COMMIT")
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        return antes - len(self)
+
+    def _borrar_marcados(self):
+        self.conn.execute("DELETE FROM lsh WHERE caso IN (SELECT id FROM _podar)")
+        self.conn.execute("DELETE FROM casos WHERE id IN (SELECT id FROM _podar)")
+
+
+def _a_bytes(vector):
+    return vector.to_bytes((vector.bit_length() + 7) // 8 or 1, "little")
+
+
+def _de_bytes(datos):
+    return int.from_bytes(datos, "little")
+
+
+# ==============================
+# RAZONAMIENTO BASADO EN CASOS + REGLAS
+# ==============================
+def inferir_con_casos(motor, biblioteca, hechos, umbral=0.9, aprender=True):
+    """Devuelve (conclusiones, origen, similitud).
+
+    Si hay un caso con similitud >= ``umbral`` se reutiliza su resultado
+    (origen "caso"); si no, se corre el motor de reglas (origen "reglas") y,
+    con ``aprender``, el resultado se guarda como caso nuevo.
+    """
+    parecidos = biblioteca.vecinos(hechos, k=1)
+    if parecidos and parecidos[0][0] >= umbral:
+        similitud, _, resultado = parecidos[0]
+        return set(resultado), "caso", similitud
+    conclusiones, _ = motor.consultar(hechos)
+    if aprender:
+        biblioteca.aprender(hechos, sorted(conclusiones))
+    return conclusiones, "reglas", parecidos[0][0] if parecidos else 0.0
+
+
+if __name__ == "__main__":
+    import tempfile
+    from motor_inferencia import MotorRete
+
+    reglas = [
+        {"condiciones": ["fiebre", "tos"], "conclusion": "gripe"},
+        {"condiciones": ["tos", "congestion"], "conclusion": "resfriado"},
+    ]
+    with tempfile.TemporaryDirectory() as tmp, BibliotecaCasos(os.path.join(tmp, "casos.db")) as biblioteca:
+        motor = MotorRete(reglas)
+        for hechos in [
+            {"fiebre": True, "tos": True, "dolor_cabeza": True},
+            {"fiebre": True, "tos": True, "dolor_cabeza": True},
+            {"tos": True, "congestion": True},
+        ]:
+            print(inferir_con_casos(motor, biblioteca, hechos))
+        print("Parecidos a {tos, congestion, fiebre}:", biblioteca.vecinos({"tos": True, "congestion": True, "fiebre": True}, k=2))
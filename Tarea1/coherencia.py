@@ -0,0 +1,192 @@
+# ==============================
+# CONTROL DE COHERENCIA
+# ==============================
+# Implementa el componente 5 de arquitectura_sistema_experto.md. Además de las
+# reglas sin condiciones, busca:
+#
+# - duplicadas:      mismas condiciones y misma conclusión.
+# - subsumidas:      otra regla con la misma conclusión pide un subconjunto de
+#                    sus condiciones (la regla más larga sobra).
+# - contradictorias: con las mismas condiciones (o un subconjunto) se concluye
+#                    x y también no_x. También una regla que pide p y no_p.
+# - inalcanzables:   alguna condición nunca puede llegar a ser cierta (no es
+#                    observable ni la concluye una regla alcanzable).
+#
+# No compara todas las reglas contra todas. Cada regla se indexa por su firma
+# (condiciones ordenadas) y por (conclusión, condición). Para saber qué reglas
+# son subconjunto o superconjunto de una nueva sólo se recorren las listas de
+# sus propias condiciones. Por eso agregar_regla() revisa una regla en tiempo
+# proporcional a lo que comparte con las demás, no al tamaño de la base.
+
+from collections import namedtuple
+
+Hallazgo = namedtuple("Hallazgo", ["tipo", "reglas", "detalle"])
+
+PREFIJO_NEGACION = "no_"
+
+
+def negar(hecho):
+    if hecho.startswith(PREFIJO_NEGACION):
+        return hecho[len(PREFIJO_NEGACION):]
+    return PREFIJO_NEGACION + hecho
+
+
+class VerificadorCoherencia:
+    """Analizador incremental de una base de reglas.
+
+    ``observables`` son los hechos que el usuario puede proporcionar. Si es
+    None, se considera observable toda condición que ninguna regla concluía
+    cuando apareció por primera vez.
+    """
+
+    def __init__(self, reglas=(), observables=None):
+        self.reglas = []               # id -> (condiciones ordenadas, conclusion)
+        self.por_firma = {}            # (condiciones, conclusion) -> primer id
+        self.por_conclusion_cond = {}  # (conclusion, condicion) -> [ids]
+        self.vacias = {}               # conclusion -> [ids sin condiciones]
+        self.conclusiones = set()
+        self._hallazgos = []
+        # Alcanzabilidad (conteo de condiciones aún no alcanzables por regla)
+        self.observables_fijos = observables is not None
+        self.alcanzables = set(observables or ())
+        self.faltan = []
+        self.esperando = {}            # condición -> [ids que esperan que sea alcanzable]
+        for regla in reglas:
+            self.agregar_regla(regla["condiciones"], regla["conclusion"])
+
+    # ----------------- Índices -----------------
+    def _subconjuntos(self, condiciones, conclusion):
+        """Ids de reglas con esa conclusión cuyas condiciones ⊆ ``condiciones``."""
+        conteo = {}
+        for c in condiciones:
+            for i in self.por_conclusion_cond.get((conclusion, c), ()):
+                conteo[i] = conteo.get(i, 0) + 1
+        encontrados = [i for i, n in conteo.items() if n == len(self.reglas[i][0])]
+        return encontrados + self.vacias.get(conclusion, [])
+
+    def _superconjuntos(self, condiciones, conclusion):
+        """Ids de reglas con esa conclusión cuyas condiciones ⊇ ``condiciones``."""
+        if not condiciones:
+            return [i for i, (_, c) in enumerate(self.reglas) if c == conclusion]
+        listas = sorted((self.por_conclusion_cond.get((conclusion, c), ()) for c in condiciones), key=len)
+        candidatos = set(listas[0])
+        for lista in listas[1:]:
+            candidatos.intersection_update(lista)
+            if not candidatos:
+                break
+        return list(candidatos)
+
+    # ----------------- Alta de reglas -----------------
+    def agregar_regla(self, condiciones, conclusion):
+        """Agrega una regla y devuelve los hallazgos que provoca."""
+        condiciones = tuple(sorted(set(condiciones)))
+        regla_id = len(self.reglas)
+        nuevos = []
+
+        if not condiciones:
+            nuevos.append(Hallazgo("vacia", (regla_id,), f"La regla de {conclusion} no tiene condiciones"))
+        for c in condiciones:
+            if PREFIJO_NEGACION + c in condiciones:
+                nuevos.append(Hallazgo("contradictoria", (regla_id,), f"La regla de {conclusion} pide {c} y {negar(c)}"))
+
+        firma = (condiciones, conclusion)
+        previa = self.por_firma.get(firma)
+        if previa is not None:
+            nuevos.append(Hallazgo("duplicada", (previa, regla_id), f"Regla de {conclusion} repetida"))
+        else:
+            for i in self._subconjuntos(condiciones, conclusion):
+                nuevos.append(Hallazgo("subsumida", (i, regla_id),
+                                       f"La regla {regla_id} de {conclusion} sobra: la regla {i} pide menos condiciones"))
+            for i in self._superconjuntos(condiciones, conclusion):
+                nuevos.append(Hallazgo("subsumida", (regla_id, i),
+                                       f"La regla {i} de {conclusion} sobra: la regla {regla_id} pide menos condiciones"))
+
+        contraria = negar(conclusion)
+        opuestas = set(self._subconjuntos(condiciones, contraria)) | set(self._superconjuntos(condiciones, contraria))
+        for i in sorted(opuestas):
+            nuevos.append(Hallazgo("contradictoria", (i, regla_id),
+                                   f"Las reglas {i} y {regla_id} concluyen {contraria} y {conclusion} y pueden cumplirse a la vez"))
+
+        # Indexar
+        self.reglas.append(firma)
+        self.por_firma.setdefault(firma, regla_id)
+        for c in condiciones:
+            self.por_conclusion_cond.setdefault((conclusion, c), []).append(regla_id)
+        if not condiciones:
+            self.vacias.setdefault(conclusion, []).append(regla_id)
+        self.conclusiones.add(conclusion)
+        self._indexar_alcance(regla_id)
+
+        self._hallazgos.extend(nuevos)
+        return nuevos
+
+    def _indexar_alcance(self, regla_id):
+        condiciones, _ = self.reglas[regla_id]
+        if not self.observables_fijos:
+            # Condición que nadie concluye (todavía): se le puede preguntar al usuario
+            for c in condiciones:
+                if c not in self.conclusiones:
+                    self.alcanzables.add(c)
+        faltan = 0
+        for c in condiciones:
+            if c not in self.alcanzables:
+                faltan += 1
+                self.esperando.setdefault(c, []).append(regla_id)
+        self.faltan.append(faltan)
+        if faltan == 0:
+            self._alcanzar(self.reglas[regla_id][1])
+
+    def _alcanzar(self, hecho):
+        pendientes = [hecho]
+        while pendientes:
+            h = pendientes.pop()
+            if h in self.alcanzables:
+                continue
+            self.alcanzables.add(h)
+            for i in self.esperando.pop(h, ()):
+                self.faltan[i] -= 1
+                if self.faltan[i] == 0:
+                    pendientes.append(self.reglas[i][1])
+
+    # ----------------- Reporte -----------------
+    def inalcanzables(self):
+        return [i for i, n in enumerate(self.faltan) if n > 0]
+
+    def hallazgos(self):
+        """Todos los hallazgos; las inalcanzables se calculan con el estado actual."""
+        resultado = list(self._hallazgos)
+        for i in self.inalcanzables():
+            condiciones, conclusion = self.reglas[i]
+            imposibles = [c for c in condiciones if c not in self.alcanzables]
+            resultado.append(Hallazgo("inalcanzable", (i,),
+                                      f"La regla {i} de {conclusion} nunca se cumple: {', '.join(imposibles)}"))
+        return resultado
+
+
+def verificar_coherencia(base_conocimiento, observables=None):
+    """Versión del documento: recibe {"enfermedad": [síntomas]} e imprime los avisos."""
+    reglas = [{"condiciones": s, "conclusion": e} for e, s in base_conocimiento.items()]
+    verificador = VerificadorCoherencia(reglas, observables)
+    for hallazgo in verificador.hallazgos():
+        print(f"⚠ {hallazgo.detalle}")
+    return verificador
+
+
+if __name__ == "__main__":
+    reglas = [
+        {"condiciones": ["fiebre", "tos", "dolor_cabeza"], "conclusion": "gripe"},
+        {"condiciones": ["fiebre", "tos"], "conclusion": "gripe"},
+        {"condiciones": ["tos", "fiebre"], "conclusion": "gripe"},
+        {"condiciones": ["fiebre", "tos"], "conclusion": "no_gripe"},
+        {"condiciones": ["tos", "congestion"], "conclusion": "resfriado"},
+        {"condiciones": ["alergia"], "conclusion": "estornudos"},
+        {"condiciones": ["estornudos"], "conclusion": "alergia"},
+        {"condiciones": [], "conclusion": "sano"},
+    ]
+    verificador = VerificadorCoherencia(reglas, observables={"fiebre", "tos", "dolor_cabeza", "congestion"})
+    for h in verificador.hallazgos():
+        print(f"⚠ [{h.tipo}] {h.detalle}")
+
+    # Incremental, como agregar_regla() del documento
+    for h in verificador.agregar_regla(["tos", "congestion", "fiebre"], "resfriado"):
+        print(f"⚠ [{h.tipo}] {h.detalle}")
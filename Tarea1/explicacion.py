@@ -0,0 +1,160 @@
+# ==============================
+# SUBSISTEMA DE EXPLICACIÓN
+# ==============================
+# Implementa el componente 9 de arquitectura_sistema_experto.md. Durante una
+# consulta con explicar=True el motor anota cada disparo de regla en una
+# Traza: qué regla se disparó, qué hecho concluyó y sobre qué hechos. Todo se
+# guarda como enteros en arreglos compactos (array('i')), así que una
+# derivación cuesta unos pocos bytes. Juntas forman un grafo (DAG) de
+# derivación que sirve para explicar conclusiones de varios pasos.
+#
+# Con explicar=False el motor no ejecuta ni una línea de este módulo.
+#
+# El texto de la explicación no se arma al inferir, sino cuando alguien lo
+# pide (Explicacion.texto()).
+
+from array import array
+
+# Límite de derivaciones por traza; al llegar a él se deja de anotar
+MAX_DERIVACIONES = 100_000
+
+# Acciones del subsistema de ejecución de órdenes (componente 8)
+ORDENES = {
+    "gripe": "Recomendar reposo y líquidos.",
+    "resfriado": "Recomendar vitamina C.",
+}
+
+
+class Traza:
+    def __init__(self, max_derivaciones=MAX_DERIVACIONES):
+        self.max_derivaciones = max_derivaciones
+        self.ids = {}               # hecho -> id entero
+        self.nombres = []           # id -> hecho
+        self.regla = array("i")     # derivación -> id de regla
+        self.conclusion = array("i")  # derivación -> id del hecho concluido
+        self.inicio = array("i", [0])  # derivación d usa premisas[inicio[d]:inicio[d+1]]
+        self.premisas = array("i")
+        self.dados = array("i")     # ids de los hechos afirmados en la consulta
+        self.truncada = False
+        self.sin_registrar = set()  # ids concluidos después de truncar la traza
+
+    def _id(self, hecho):
+        i = self.ids.get(hecho)
+        if i is None:
+            i = self.ids[hecho] = len(self.nombres)
+            self.nombres.append(hecho)
+        return i
+
+    def afirmar(self, hechos):
+        """Anota los hechos proporcionados: se explican como tales aunque una regla también los concluya."""
+        self.dados.extend(self._id(h) for h in hechos)
+
+    def registrar(self, regla_id, conclusion, premisas):
+        if len(self.regla) >= self.max_derivaciones:
+            self.truncada = True
+            self.sin_registrar.add(self._id(conclusion))
+            return
+        self.regla.append(regla_id)
+        self.conclusion.append(self._id(conclusion))
+        self.premisas.extend(self._id(p) for p in premisas)
+        self.inicio.append(len(self.premisas))
+
+    def __len__(self):
+        return len(self.regla)
+
+    def bytes(self):
+        """Memoria de los arreglos de la traza (sin contar el diccionario de nombres)."""
+        return sum(a.itemsize * len(a) for a in (self.regla, self.conclusion, self.inicio, self.premisas, self.dados))
+
+    def derivaciones_de(self, hecho):
+        i = self.ids.get(hecho)
+        if i is None:
+            return []
+        return [d for d, c in enumerate(self.conclusion) if c == i]
+
+    def premisas_de(self, derivacion):
+        return [self.nombres[p] for p in self.premisas[self.inicio[derivacion]:self.inicio[derivacion + 1]]]
+
+    def explicar(self, hecho):
+        """Líneas de texto con la cadena de reglas que llevó a ``hecho``."""
+        # Índice conclusión -> primera derivación, construido al pedir la explicación
+        primera = {}
+        for d, c in enumerate(self.conclusion):
+            primera.setdefault(c, d)
+        dados = set(self.dados)
+
+        lineas = []
+        explicados = set()
+        pila = [(hecho, 0)]
+        while pila:
+            actual, nivel = pila.pop()
+            sangria = "  " * nivel
+            i = self.ids.get(actual)
+            d = primera.get(i)
+            if i in dados:
+                lineas.append(f"{sangria}- {actual}: hecho proporcionado")
+                continue
+            if d is None:
+                if i in self.sin_registrar:
+                    lineas.append(f"{sangria}- {actual}: derivación no registrada (traza truncada)")
+                else:
+                    lineas.append(f"{sangria}- {actual}: no se derivó")
+                continue
+            if actual in explicados:
+                lineas.append(f"{sangria}- {actual}: (ya explicado arriba)")
+                continue
+            explicados.add(actual)
+            premisas = self.premisas_de(d)
+            condicion = f" (si {' y '.join(premisas)})" if premisas else ""
+            lineas.append(f"{sangria}- {actual}: por la regla {self.regla[d]}{condicion}")
+            for premisa in reversed(premisas):
+                pila.append((premisa, nivel + 1))
+        if self.truncada:
+            lineas.append("(la traza se truncó; la explicación puede estar incompleta)")
+        return lineas
+
+
+class Explicacion:
+    """Explicación perezosa de una orden: el texto se genera al pedirlo."""
+
+    def __init__(self, traza, conclusion, accion):
+        self.traza = traza
+        self.conclusion = conclusion
+        self.accion = accion
+        self._texto = None
+
+    def texto(self):
+        if self._texto is None:
+            if self.traza is None:
+                lineas = ["(consulta sin explicación; usar explicar=True)"]
+            else:
+                lineas = self.traza.explicar(self.conclusion)
+            self._texto = "\n".join([f"Acción: {self.accion} Porque:"] + lineas)
+        return self._texto
+
+    def __str__(self):
+        return self.texto()
+
+
+def ejecutar_orden(diagnostico, traza=None, ordenes=ORDENES):
+    """Ejecuta las acciones del diagnóstico y devuelve sus explicaciones (perezosas)."""
+    explicaciones = []
+    for conclusion, accion in ordenes.items():
+        if conclusion in diagnostico:
+            print(f"Acción: {accion}")
+            explicaciones.append(Explicacion(traza, conclusion, accion))
+    return explicaciones
+
+
+if __name__ == "__main__":
+    from motor_inferencia import MotorRete
+
+    reglas = [
+        {"condiciones": ["fiebre", "tos"], "conclusion": "infeccion_respiratoria"},
+        {"condiciones": ["infeccion_respiratoria", "dolor_cabeza"], "conclusion": "gripe"},
+        {"condiciones": ["tos", "congestion"], "conclusion": "resfriado"},
+    ]
+    motor = MotorRete(reglas)
+    diagnostico, traza = motor.consultar({"fiebre": True, "tos": True, "dolor_cabeza": True}, explicar=True)
+    for explicacion in ejecutar_orden(diagnostico, traza):
+        print(explicacion)
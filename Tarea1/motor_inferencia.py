@@ -0,0 +1,257 @@
+# ==============================
+# MOTOR DE INFERENCIA (encadenamiento hacia adelante, estilo Rete)
+# ==============================
+# Implementa el componente 6 de arquitectura_sistema_experto.md. En lugar de
+# revisar todas las reglas con all(...) en cada llamada a inferir(hechos), las
+# reglas se compilan en una red:
+#
+# - Nodos alfa: un índice condición -> nodos que prueban esa condición.
+# - Nodos beta: un árbol de prefijos de condiciones. Dos reglas que comparten
+#   sus primeras condiciones comparten también esos nodos. Las condiciones de
+#   cada regla se ordenan de la más frecuente a la menos frecuente para
+#   maximizar lo que se comparte.
+# - Cada regla cuelga del nodo de su última condición. Un nodo está activo
+#   sólo si su padre está activo y su condición es un hecho presente.
+#
+# Al afirmar o retractar un hecho sólo se recorren los nodos afectados. Las
+# conclusiones se vuelven hechos (encadenamiento) y llevan un contador de
+# soporte. Al retractar se usa "borrar y re-derivar": primero se quita todo
+# lo que dependía del hecho y luego se recupera lo que sigue teniendo otra
+# justificación. Así los ciclos de reglas (a -> b, b -> a) no se sostienen
+# solos.
+#
+# Formato de reglas (el mismo del documento):
+#   {"condiciones": ["fiebre", "tos"], "conclusion": "gripe"}
+
+from collections import Counter
+
+
+class _Nodo:
+    __slots__ = ("condicion", "padre", "hijos", "reglas", "activo")
+
+    def __init__(self, condicion, padre):
+        self.condicion = condicion
+        self.padre = padre
+        self.hijos = {}
+        self.reglas = []
+        self.activo = False
+
+
+class MotorRete:
+    def __init__(self, reglas=()):
+        self.raiz = _Nodo(None, None)
+        self.raiz.activo = True
+        self.alfa = {}            # condición -> [nodos beta que la prueban]
+        self.reglas = []          # id -> (condiciones, conclusion)
+        self.base = set()         # hechos afirmados por el usuario
+        self.soporte = Counter()  # hecho -> nº de reglas activas que lo concluyen
+        self.frecuencia = Counter()
+        self._borrados = set()    # hechos en pausa durante una retractación
+        self._traza = None        # Traza de la consulta en curso (explicar=True)
+        self.compilar(reglas)
+
+    # ----------------- Compilación de la red -----------------
+    def compilar(self, reglas):
+        """Agrega varias reglas ordenando sus condiciones por frecuencia global."""
+        reglas = [(list(dict.fromkeys(r["condiciones"])), r["conclusion"]) for r in reglas]
+        for condiciones, _ in reglas:
+            self.frecuencia.update(condiciones)
+        return [self._agregar(condiciones, conclusion) for condiciones, conclusion in reglas]
+
+    def agregar_regla(self, condiciones, conclusion):
+        """Agrega una regla (aunque ya haya hechos cargados); devuelve su id."""
+        condiciones = list(dict.fromkeys(condiciones))
+        self.frecuencia.update(condiciones)
+        return self._agregar(condiciones, conclusion)
+
+    def _agregar(self, condiciones, conclusion):
+        orden = sorted(condiciones, key=lambda c: (-self.frecuencia[c], c))
+        nodo = self.raiz
+        for condicion in orden:
+            hijo = nodo.hijos.get(condicion)
+            if hijo is None:
+                hijo = _Nodo(condicion, nodo)
+                hijo.activo = nodo.activo and self.presente(condicion)
+                nodo.hijos[condicion] = hijo
+                self.alfa.setdefault(condicion, []).append(hijo)
+            nodo = hijo
+
+        regla_id = len(self.reglas)
+        self.reglas.append((tuple(orden), conclusion))
+        nodo.reglas.append(regla_id)
+        if nodo.activo:
+            pendientes = []
+            self._disparar(regla_id, pendientes)
+            self._propagar_altas(pendientes)
+        return regla_id
+
+    def num_nodos(self):
+        return sum(len(nodos) for nodos in self.alfa.values())
+
+    # ----------------- Hechos -----------------
+    def presente(self, hecho):
+        return hecho in self.base or (self.soporte[hecho] > 0 and hecho not in self._borrados)
+
+    def afirmar(self, hecho):
+        if hecho in self.base:
+            return
+        estaba = self.presente(hecho)
+        self.base.add(hecho)
+        if not estaba:
+            self._propagar_altas([hecho])
+
+    def retractar(self, hecho):
+        if hecho not in self.base:
+            return
+        self.base.remove(hecho)
+        if self.soporte[hecho] > 0:
+            # Podría sostenerse sólo a través de un ciclo: se re-deriva después
+            self._borrados.add(hecho)
+        self._propagar_bajas([hecho])
+        self._rederivar()
+
+    def actualizar(self, hechos):
+        """Aplica un diccionario {hecho: True/False} como en la Base de Hechos."""
+        for hecho, valor in hechos.items():
+            if valor:
+                self.afirmar(hecho)
+            else:
+                self.retractar(hecho)
+
+    def reiniciar_hechos(self):
+        """Vacía la Base de Hechos (las reglas compiladas se conservan)."""
+        pila = [n for n in self.raiz.hijos.values() if n.activo]
+        while pila:
+            n = pila.pop()
+            n.activo = False
+            pila.extend(h for h in n.hijos.values() if h.activo)
+        self.base.clear()
+        self.soporte.clear()
+        self._borrados.clear()
+        # Las reglas sin condiciones cuelgan de la raíz y siempre se cumplen
+        pendientes = []
+        for regla_id in self.raiz.reglas:
+            self._disparar(regla_id, pendientes)
+        self._propagar_altas(pendientes)
+
+    def consultar(self, hechos, explicar=False, max_derivaciones=None):
+        """Infiere desde cero con ``hechos``; devuelve (conclusiones, traza).
+
+        Con explicar=True cada disparo de regla se anota en una Traza
+        (ver explicacion.py); si no, la traza es None y no hay costo extra.
+        """
+        traza = None
+        if explicar:
+            from explicacion import Traza, MAX_DERIVACIONES
+            traza = Traza(MAX_DERIVACIONES if max_derivaciones is None else max_derivaciones)
+            self._traza = traza
+            # Sólo durante esta consulta se usa la versión que anota
+            self._disparar = self._disparar_con_traza
+        try:
+            self.reiniciar_hechos()
+            self.actualizar(hechos)
+            if explicar:
+                traza.afirmar(self.base)
+        finally:
+            if explicar:
+                del self._disparar
+                self._traza = None
+        return self.conclusiones(), traza
+
+    def hechos(self):
+        """Todos los hechos presentes (afirmados + concluidos)."""
+        return self.base | self.conclusiones()
+
+    def conclusiones(self):
+        """Hechos concluidos por alguna regla activa."""
+        return {h for h, n in self.soporte.items() if n > 0 and h not in self._borrados}
+
+    # ----------------- Propagación -----------------
+    def _disparar(self, regla_id, pendientes):
+        conclusion = self.reglas[regla_id][1]
+        self.soporte[conclusion] += 1
+        if conclusion in self.base:
+            return
+        if conclusion in self._borrados:
+            self._borrados.discard(conclusion)
+            pendientes.append(conclusion)
+        elif self.soporte[conclusion] == 1:
+            pendientes.append(conclusion)
+
+    def _disparar_con_traza(self, regla_id, pendientes):
+        condiciones, conclusion = self.reglas[regla_id]
+        self._traza.registrar(regla_id, conclusion, condiciones)
+        MotorRete._disparar(self, regla_id, pendientes)
+
+    def _propagar_altas(self, pendientes):
+        while pendientes:
+            hecho = pendientes.pop()
+            for nodo in self.alfa.get(hecho, ()):
+                if nodo.activo or not nodo.padre.activo:
+                    continue
+                pila = [nodo]
+                while pila:
+                    n = pila.pop()
+                    n.activo = True
+                    for regla_id in n.reglas:
+                        self._disparar(regla_id, pendientes)
+                    for condicion, hijo in n.hijos.items():
+                        if not hijo.activo and self.presente(condicion):
+                            pila.append(hijo)
+
+    def _propagar_bajas(self, pendientes):
+        # Fase de sobre-borrado: todo lo que dependía del hecho se pausa
+        while pendientes:
+            hecho = pendientes.pop()
+            for nodo in self.alfa.get(hecho, ()):
+                if not nodo.activo:
+                    continue
+                pila = [nodo]
+                while pila:
+                    n = pila.pop()
+                    n.activo = False
+                    for regla_id in n.reglas:
+                        conclusion = self.reglas[regla_id][1]
+                        self.soporte[conclusion] -= 1
+                        if conclusion not in self.base and conclusion not in self._borrados:
+                            self._borrados.add(conclusion)
+                            pendientes.append(conclusion)
+                    for hijo in n.hijos.values():
+                        if hijo.activo:
+                            pila.append(hijo)
+
+    def _rederivar(self):
+        # Lo pausado que aún tiene reglas activas que lo concluyen vuelve
+        pendientes = [h for h in self._borrados if self.soporte[h] > 0]
+        for hecho in pendientes:
+            self._borrados.discard(hecho)
+        self._propagar_altas(pendientes)
+        for hecho in self._borrados:
+            if self.soporte[hecho] == 0:
+                del self.soporte[hecho]
+        self._borrados.clear()
+
+
+# ==============================
+# COMPATIBILIDAD CON EL DOCUMENTO
+# ==============================
+def reglas_desde_base(base_conocimiento):
+    """Convierte {"gripe": ["fiebre", "tos"]} al formato de reglas."""
+    return [{"condiciones": sintomas, "conclusion": enfermedad}
+            for enfermedad, sintomas in base_conocimiento.items()]
+
+
+def inferir_ingenuo(reglas, hechos):
+    """Versión original: revisa todas las reglas con all(...) hasta un punto fijo.
+
+    Se conserva como referencia para los benchmarks.
+    """
+    presentes = {h for h, v in hechos.items() if v} if isinstance(hechos, dict) else set(hechos)
+    cambio = True
+    while cambio:
+        cambio = False
+        for regla in reglas:
+            if regla["conclusion"] not in presentes and all(c in presentes for c in regla["condiciones"]):
+                presentes.add(regla["conclusion"])
+                cambio = True
+    return presentes
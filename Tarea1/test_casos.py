@@ -0,0 +1,66 @@
+# Pruebas de la biblioteca de casos (python -m pytest Tarea1)
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from casos import BibliotecaCasos, inferir_con_casos
+from motor_inferencia import MotorRete
+
+REGLAS = [
+    {"condiciones": ["fiebre", "tos"], "conclusion": "gripe"},
+    {"condiciones": ["tos", "congestion"], "conclusion": "resfriado"},
+]
+
+
+def test_hechos_fuera_del_vocabulario_cuentan_en_la_similitud(tmp_path):
+    with BibliotecaCasos(str(tmp_path / "casos.db")) as biblioteca:
+        motor = MotorRete(REGLAS)
+        biblioteca.aprender({"fiebre": True, "tos": True}, ["gripe"])
+
+        parecidos = biblioteca.vecinos({"fiebre": True, "tos": True, "congestion": True}, exacto=True)
+        assert parecidos[0][0] == 2 / 3
+
+        conclusiones, origen, similitud = inferir_con_casos(
+            motor, biblioteca, {"fiebre": True, "tos": True, "congestion": True})
+        assert origen == "reglas"
+        assert similitud == 2 / 3
+        assert conclusiones == {"gripe", "resfriado"}
+
+
+def test_caso_identico_se_reutiliza(tmp_path):
+    with BibliotecaCasos(str(tmp_path / "casos.db")) as biblioteca:
+        motor = MotorRete(REGLAS)
+        hechos = {"fiebre": True, "tos": True}
+        assert inferir_con_casos(motor, biblioteca, hechos)[1] == "reglas"
+        conclusiones, origen, similitud = inferir_con_casos(motor, biblioteca, hechos)
+        assert (conclusiones, origen, similitud) == ({"gripe"}, "caso", 1.0)
+
+
+def test_claves_lsh_fijas_entre_interpretes(tmp_path):
+    # Valores fijos: si cambian, las bases ya guardadas dejan de encontrar sus cubetas
+    with BibliotecaCasos(str(tmp_path / "casos.db")) as biblioteca:
+        claves = biblioteca._claves_lsh([0, 3, 7])
+        assert claves == biblioteca._claves_lsh([7, 0, 3])
+        assert claves[:2] == [-5441974376655106572, -3984508674220069993]
+
+
+def test_base_antigua_se_reindexa(tmp_path):
+    ruta = str(tmp_path / "casos.db")
+    with BibliotecaCasos(ruta) as biblioteca:
+        biblioteca.aprender({"fiebre": True, "tos": True}, ["gripe"])
+        biblioteca.conn.execute("UPDATE lsh SET clave = clave + 1")
+        biblioteca.conn.execute("PRAGMA user_version = 0")
+    with BibliotecaCasos(ruta) as biblioteca:
+        assert biblioteca.vecinos({"fiebre": True, "tos": True})[0][0] == 1.0
+
+
+def test_vecinos_no_escribe_y_podar_ve_los_usos(tmp_path):
+    with BibliotecaCasos(str(tmp_path / "casos.db")) as biblioteca:
+        usado, viejo = biblioteca.aprender_varios([({"fiebre": True}, ["a"]), ({"tos": True}, ["b"])], ahora=0)
+        cambios = biblioteca.conn.total_changes
+        biblioteca.vecinos({"fiebre": True}, k=1, ahora=10)
+        assert biblioteca.conn.total_changes == cambios
+        assert biblioteca.podar(max_casos=1, ahora=10) == 1
+        assert biblioteca.conn.execute("SELECT id, usos, usado FROM casos").fetchall() == [(usado, 1, 10)]
@@ -0,0 +1,49 @@
+# Pruebas del subsistema de explicación (python -m pytest Tarea1)
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from motor_inferencia import MotorRete
+
+
+def test_hecho_proporcionado_no_se_explica_por_reglas():
+    motor = MotorRete([
+        {"condiciones": ["tos"], "conclusion": "gripe"},
+        {"condiciones": ["gripe"], "conclusion": "tos"},
+    ])
+    _, traza = motor.consultar({"tos": True}, explicar=True)
+    assert traza.explicar("tos") == ["- tos: hecho proporcionado"]
+    assert traza.explicar("gripe") == ["- gripe: por la regla 0 (si tos)", "  - tos: hecho proporcionado"]
+
+
+def test_hecho_no_derivado():
+    motor = MotorRete([{"condiciones": ["tos", "congestion"], "conclusion": "resfriado"}])
+    _, traza = motor.consultar({"tos": True}, explicar=True)
+    assert traza.explicar("resfriado") == ["- resfriado: no se derivó"]
+
+
+def test_traza_truncada_no_inventa_hechos_proporcionados():
+    motor = MotorRete([
+        {"condiciones": ["fiebre", "tos"], "conclusion": "infeccion"},
+        {"condiciones": ["infeccion"], "conclusion": "gripe"},
+    ])
+    conclusiones, traza = motor.consultar({"fiebre": True, "tos": True}, explicar=True, max_derivaciones=1)
+    assert "gripe" in conclusiones
+    assert traza.explicar("gripe") == [
+        "- gripe: derivación no registrada (traza truncada)",
+        "(la traza se truncó; la explicación puede estar incompleta)",
+    ]
+
+
+def test_max_derivaciones_cero_no_registra_nada():
+    motor = MotorRete([{"condiciones": ["tos"], "conclusion": "gripe"}])
+    _, traza = motor.consultar({"tos": True}, explicar=True, max_derivaciones=0)
+    assert len(traza) == 0 and traza.truncada
+
+
+def test_regla_sin_condiciones():
+    motor = MotorRete([{"condiciones": [], "conclusion": "sano"}])
+    _, traza = motor.consultar({"tos": True}, explicar=True)
+    assert traza.explicar("sano") == ["- sano: por la regla 0"]
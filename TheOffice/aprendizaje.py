@@ -0,0 +1,202 @@
+# ==============================
+# APRENDER DE LAS PARTIDAS
+# ==============================
+# Cada partida se anota en una línea de partidas.jsonl: las preguntas con su
+# respuesta, cómo terminó y (si se sabe) en qué personaje pensaba el jugador.
+#
+# Cada cierto número de partidas la bitácora se resume en estadísticas por
+# rasgo (categoría, valor), leyendo sólo las líneas nuevas:
+#
+# - cuántas veces se preguntó y cuántas se contestó "sí" (prior de respuesta);
+# - en las partidas con personaje conocido, cuántas respuestas no coinciden
+#   con sus datos (qué tan seguido los jugadores se equivocan en ese rasgo).
+#
+# elegir_pregunta() usa esas estadísticas para preguntar primero lo que más
+# información da: parte bien a los candidatos que quedan y los jugadores lo
+# contestan de forma consistente. Los rasgos que no separan a nadie o que casi
+# nadie contesta bien se descartan.
+#
+# Uso: python aprendizaje.py [partidas.jsonl] [characters.json]   (resumen por rasgo)
+
+import json
+import math
+import os
+import random
+import sys
+
+from coherencia import CATEGORIAS
+
+BITACORA_FILE = "partidas.jsonl"
+ESTADISTICAS_FILE = "estadisticas.json"
+
+ACTUALIZAR_CADA = 10        # partidas entre actualizaciones de las estadísticas
+PESO_PRIOR = 2.0            # cuánto pesa el prior de respuesta frente a los candidatos
+ERROR_PREVIO = (1, 20)      # (errores, respuestas) supuestos antes de tener datos
+MAX_INCONSISTENCIA = 0.35   # arriba de esto el rasgo no se pregunta
+MIN_GANANCIA = 0.01         # bits; por debajo la pregunta no aporta
+
+ACIERTO = "acierto"
+FALLO = "fallo"
+SIN_CANDIDATOS = "sin_candidatos"
+
+
+def tiene(personaje, categoria, valor):
+    """Mismo criterio que usa el juego para filtrar con una respuesta."""
+    return (valor in personaje.get(categoria, [])) or (valor == personaje.get(categoria))
+
+
+# ==============================
+# BITÁCORA
+# ==============================
+class BitacoraPartidas:
+    def __init__(self, archivo=BITACORA_FILE):
+        self.archivo = archivo
+
+    def registrar(self, camino, resultado, nombre=None, adivinado=None):
+        """``camino``: lista de (categoría, valor, respuesta_si)."""
+        partida = {"c": [[c, v, int(si)] for c, v, si in camino], "r": resultado}
+        if nombre:
+            partida["n"] = nombre
+        if adivinado:
+            partida["a"] = adivinado
+        with open(self.archivo, "a", encoding="utf-8") as f:
+            f.write(json.dumps(partida, ensure_ascii=False, separators=(",", ":")) + "\n")
+
+    def leer(self, desde=0):
+        """Genera (posición siguiente, partida) a partir del byte ``desde``."""
+        if not os.path.exists(self.archivo):
+            return
+        with open(self.archivo, "rb") as f:
+            f.seek(desde)
+            for linea in f:
+                if not linea.endswith(b"\n"):
+                    break   # línea a medio escribir; se lee en la próxima actualización
+                desde += len(linea)
+                if linea.strip():
+                    yield desde, json.loads(linea)
+
+
+# ==============================
+# ESTADÍSTICAS POR RASGO
+# ==============================
+class EstadisticasPreguntas:
+    def __init__(self, archivo=ESTADISTICAS_FILE):
+        self.archivo = archivo
+        self.leidos = 0     # bytes de la bitácora ya resumidos
+        self.rasgos = {}    # (categoria, valor) -> [preguntas, si, conocidas, inconsistentes]
+        if archivo and os.path.exists(archivo):
+            with open(archivo, "r", encoding="utf-8") as f:
+                try:
+                    datos = json.load(f)
+                except json.JSONDecodeError:
+                    datos = {}
+            self.leidos = datos.get("leidos", 0)
+            for c, v, *conteos in datos.get("rasgos", []):
+                self.rasgos[(c, v)] = conteos
+
+    def guardar(self):
+        datos = {"leidos": self.leidos, "rasgos": [[c, v, *n] for (c, v), n in self.rasgos.items()]}
+        with open(self.archivo, "w", encoding="utf-8") as f:
+            json.dump(datos, f, ensure_ascii=False)
+
+    def actualizar(self, bitacora, personajes):
+        """Incorpora las partidas nuevas de la bitácora; devuelve cuántas leyó."""
+        por_nombre = {p["nombre"].lower(): p for p in personajes}
+        leidas = 0
+        for posicion, partida in bitacora.leer(self.leidos):
+            personaje = por_nombre.get(partida.get("n", "").lower())
+            for categoria, valor, si in partida["c"]:
+                conteo = self.rasgos.setdefault((categoria, valor), [0, 0, 0, 0])
+                conteo[0] += 1
+                conteo[1] += si
+                if personaje is not None:
+                    conteo[2] += 1
+                    conteo[3] += bool(si) != tiene(personaje, categoria, valor)
+            self.leidos = posicion
+            leidas += 1
+        return leidas
+
+    def prior_si(self, categoria, valor):
+        """Fracción de "sí" observada (None si nunca se preguntó)."""
+        conteo = self.rasgos.get((categoria, valor))
+        if not conteo or not conteo[0]:
+            return None
+        return (conteo[1] + 1) / (conteo[0] + 2)
+
+    def inconsistencia(self, categoria, valor):
+        """Probabilidad estimada de que el jugador conteste mal este rasgo."""
+        errores, respuestas = ERROR_PREVIO
+        conteo = self.rasgos.get((categoria, valor))
+        if conteo:
+            errores += conteo[3]
+            respuestas += conteo[2]
+        return errores / respuestas
+
+
+# ==============================
+# SELECCIÓN DE PREGUNTAS
+# ==============================
+def _entropia(p):
+    if p <= 0.0 or p >= 1.0:
+        return 0.0
+    return -p * math.log2(p) - (1 - p) * math.log2(1 - p)
+
+
+def ganancia(con, total, prior=None, error=0.0):
+    """Bits esperados de una pregunta que ``con`` de ``total`` candidatos cumplen,
+    si el jugador se equivoca con probabilidad ``error``."""
+    p = con / total
+    if prior is not None:
+        p = (con + PESO_PRIOR * prior) / (total + PESO_PRIOR)
+    p_si = p * (1 - error) + (1 - p) * error
+    return _entropia(p_si) - _entropia(error)
+
+
+def elegir_pregunta(candidatos, preguntadas, estadisticas=None, categorias=CATEGORIAS, rnd=random):
+    """Devuelve (categoría, valor) de la mejor pregunta o None si no queda ninguna.
+
+    Si ninguna pregunta separa a los candidatos (queda uno, o son
+    indistinguibles) se devuelve la de confirmación más confiable.
+    """
+    conteos = {}
+    for personaje in candidatos:
+        for categoria in categorias:
+            valor = personaje.get(categoria)
+            valores = valor if isinstance(valor, list) else [valor] if isinstance(valor, str) and valor else []
+            for v in valores:
+                if v not in preguntadas:
+                    conteos[(categoria, v)] = 0
+    if not conteos:
+        return None
+    # El juego filtra con tiene(); con valores de texto puede cumplirlo más de
+    # un personaje aunque no sea su valor exacto, así que se cuenta igual.
+    for categoria, v in conteos:
+        conteos[(categoria, v)] = sum(1 for p in candidatos if tiene(p, categoria, v))
+
+    total = len(candidatos)
+    mejor, mejor_puntaje = None, None
+    confirmacion, menor_error = None, None
+    for (categoria, v), con in conteos.items():
+        error = estadisticas.inconsistencia(categoria, v) if estadisticas else 0.0
+        desempate = rnd.random()
+        if menor_error is None or (error, desempate) < menor_error:
+            confirmacion, menor_error = (categoria, v), (error, desempate)
+        if con == 0 or con == total or error > MAX_INCONSISTENCIA:
+            continue
+        prior = estadisticas.prior_si(categoria, v) if estadisticas else None
+        puntaje = (ganancia(con, total, prior, error), desempate)
+        if puntaje[0] >= MIN_GANANCIA and (mejor_puntaje is None or puntaje > mejor_puntaje):
+            mejor, mejor_puntaje = (categoria, v), puntaje
+    return mejor or confirmacion
+
+
+if __name__ == "__main__":
+    bitacora = BitacoraPartidas(sys.argv[1] if len(sys.argv) > 1 else BITACORA_FILE)
+    with open(sys.argv[2] if len(sys.argv) > 2 else "characters.json", "r", encoding="utf-8") as f:
+        personajes = json.load(f)
+    estadisticas = EstadisticasPreguntas(None)
+    print(f"{estadisticas.actualizar(bitacora, personajes)} partidas leídas")
+    filas = sorted(estadisticas.rasgos.items(), key=lambda x: -x[1][0])
+    for (categoria, valor), (preguntas, si, conocidas, inconsistentes) in filas[:20]:
+        print(f"{categoria:>12} {valor!r:30} preguntas={preguntas:4d} sí={si / preguntas:5.0%} "
+              f"errores={estadisticas.inconsistencia(categoria, valor):5.1%}")
@@ -0,0 +1,208 @@
+# ==============================
+# BENCHMARK: repetición de partidas con el selector anterior y el nuevo
+# ==============================
+# Repite sin interfaz las partidas de una bitácora (partidas.jsonl). El
+# personaje de cada partida es el que anotó el jugador; si se le hace una
+# pregunta que ya contestó en la partida original se usa esa respuesta, y si
+# no, la de sus datos (equivocada con la probabilidad que estimaron las
+# estadísticas para ese rasgo).
+#
+# Se comparan:
+# - "anterior": categorías en orden fijo desde "rol" en cada partida y un
+#               valor al azar (como era main.py);
+# - "nuevo":    elegir_pregunta() con las estadísticas de la bitácora.
+#
+# La bitácora se parte en orden: las estadísticas del selector nuevo se
+# ajustan con las primeras partidas (--entrenamiento) y sólo se repiten las
+# restantes, que el selector no vio.
+#
+# Sin --bitacora se genera una simulando jugadores que se equivocan más en
+# los rasgos subjetivos (personalidad, aspecto) que en los objetivos.
+#
+# Uso: python bench_preguntas.py [--bitacora partidas.jsonl] [--partidas 2000] [--personajes N]
+#                                [--entrenamiento 0.7]
+
+import argparse
+import json
+import os
+import random
+import tempfile
+
+from aprendizaje import (ACIERTO, FALLO, SIN_CANDIDATOS, BitacoraPartidas, EstadisticasPreguntas,
+                         elegir_pregunta, tiene)
+from coherencia import CATEGORIAS
+
+MIN_PREGUNTAS = 5   # igual que MIN_QUESTIONS en main.py
+ENTRENAMIENTO = 0.7  # fracción de la bitácora con la que se ajustan las estadísticas
+ERROR_SIMULADO = {"rol": 0.02, "genero": 0.01, "narrativa": 0.10, "aspecto": 0.12,
+                  "personalidad": 0.25, "estilo": 0.08, "distintivo": 0.05}
+
+
+def generar_personajes(n, rnd, valores_por_categoria=None):
+    """Base sintética con la misma forma que characters.json."""
+    valores_por_categoria = valores_por_categoria or {
+        "rol": 12, "genero": 2, "aspecto": 40, "personalidad": 60, "narrativa": 2, "estilo": 40, "distintivo": 50,
+    }
+    listas = {"aspecto": 3, "personalidad": 4, "estilo": 2, "distintivo": 3}
+    personajes = []
+    for i in range(n):
+        p = {"nombre": f"Personaje {i}"}
+        for categoria, cuantos in valores_por_categoria.items():
+            if categoria in listas:
+                p[categoria] = [f"{categoria}_{v}" for v in rnd.sample(range(cuantos), listas[categoria])]
+            else:
+                p[categoria] = f"{categoria}_{rnd.randrange(cuantos)}"
+        personajes.append(p)
+    return personajes
+
+
+# ----------------- Selectores -----------------
+class SelectorAnterior:
+    """Selector original de main.py: categoría por turno, valor al azar."""
+
+    def __init__(self, rnd):
+        self.rnd = rnd
+        self.indice = 0
+
+    def reiniciar(self):
+        """Como reset_game(): cada partida empieza por la primera categoría."""
+        self.indice = 0
+
+    def __call__(self, candidatos, preguntadas):
+        for _ in range(len(CATEGORIAS)):
+            categoria = CATEGORIAS[self.indice % len(CATEGORIAS)]
+            self.indice += 1
+            opciones = []
+            for p in candidatos:
+                valor = p.get(categoria)
+                for v in valor if isinstance(valor, list) else [valor] if isinstance(valor, str) else []:
+                    if v not in preguntadas:
+                        opciones.append(v)
+            if opciones:
+                return categoria, self.rnd.choice(opciones)
+        return None
+
+
+class SelectorNuevo:
+    def __init__(self, estadisticas, rnd):
+        self.estadisticas = estadisticas
+        self.rnd = rnd
+
+    def reiniciar(self):
+        pass
+
+    def __call__(self, candidatos, preguntadas):
+        return elegir_pregunta(candidatos, preguntadas, self.estadisticas, CATEGORIAS, self.rnd)
+
+
+# ----------------- Partida sin interfaz -----------------
+def jugar(personajes, selector, responder):
+    """Mismo flujo que next_question()/answer() de main.py.
+
+    Devuelve (camino, resultado, adivinado)."""
+    selector.reiniciar()
+    candidatos = list(personajes)
+    preguntadas = set()
+    camino = []
+    while True:
+        if not candidatos:
+            return camino, SIN_CANDIDATOS, None
+        if len(camino) >= MIN_PREGUNTAS and len(candidatos) == 1:
+            return camino, None, candidatos[0]["nombre"]
+        siguiente = selector(candidatos, preguntadas)
+        if siguiente is None:
+            return camino, None, candidatos[0]["nombre"]
+        categoria, valor = siguiente
+        si = responder(categoria, valor)
+        candidatos = [p for p in candidatos if tiene(p, categoria, valor) == si]
+        camino.append((categoria, valor, si))
+        preguntadas.add(valor)
+
+
+def simular_bitacora(personajes, partidas, bitacora, rnd):
+    """Juega con el selector anterior y jugadores con ERROR_SIMULADO."""
+    for _ in range(partidas):
+        objetivo = rnd.choice(personajes)
+
+        def responder(categoria, valor):
+            verdad = tiene(objetivo, categoria, valor)
+            return verdad if rnd.random() >= ERROR_SIMULADO.get(categoria, 0.05) else not verdad
+
+        camino, resultado, adivinado = jugar(personajes, SelectorAnterior(rnd), responder)
+        if resultado is None:
+            resultado = ACIERTO if adivinado == objetivo["nombre"] else FALLO
+        bitacora.registrar(camino, resultado, objetivo["nombre"], adivinado)
+
+
+def repetir(personajes, partidas, selector, jugador, rnd):
+    """Repite ``partidas``; las respuestas no grabadas salen de los datos del
+    personaje, equivocadas según las estadísticas ``jugador``."""
+    por_nombre = {p["nombre"].lower(): p for p in personajes}
+    preguntas = aciertos = jugadas = 0
+    for partida in partidas:
+        objetivo = por_nombre.get(partida.get("n", "").lower())
+        if objetivo is None:
+            continue
+        grabadas = {(c, v): bool(si) for c, v, si in partida["c"]}
+
+        def responder(categoria, valor):
+            if (categoria, valor) in grabadas:
+                return grabadas[(categoria, valor)]
+            verdad = tiene(objetivo, categoria, valor)
+            return verdad if rnd.random() >= jugador.inconsistencia(categoria, valor) else not verdad
+
+        camino, _, adivinado = jugar(personajes, selector, responder)
+        preguntas += len(camino)
+        aciertos += adivinado == objetivo["nombre"]
+        jugadas += 1
+    return jugadas, preguntas / max(jugadas, 1), aciertos / max(jugadas, 1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Repetición de partidas: selector anterior vs. nuevo")
+    parser.add_argument("--bitacora", help="partidas.jsonl grabado por main.py")
+    parser.add_argument("--personajes", type=int, default=0, help="usar N personajes sintéticos")
+    parser.add_argument("--partidas", type=int, default=2000, help="partidas a simular sin --bitacora")
+    parser.add_argument("--entrenamiento", type=float, default=ENTRENAMIENTO,
+                        help="fracción inicial de la bitácora para ajustar las estadísticas")
+    args = parser.parse_args()
+
+    rnd = random.Random(0)
+    if args.personajes:
+        personajes = generar_personajes(args.personajes, rnd)
+    else:
+        with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), "characters.json"), "r", encoding="utf-8") as f:
+            personajes = json.load(f)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.bitacora:
+            bitacora = BitacoraPartidas(args.bitacora)
+        else:
+            bitacora = BitacoraPartidas(os.path.join(tmp, "partidas.jsonl"))
+            simular_bitacora(personajes, args.partidas, bitacora, rnd)
+
+        partidas = [p for _, p in bitacora.leer()]
+        tamano = os.path.getsize(bitacora.archivo)
+        corte = int(len(partidas) * args.entrenamiento)
+        print(f"{len(personajes)} personajes, {len(partidas)} partidas en la bitácora "
+              f"({tamano / max(len(partidas), 1):.0f} bytes por partida); "
+              f"{corte} para ajustar, {len(partidas) - corte} para repetir")
+
+        # Estadísticas del selector: sólo las partidas de entrenamiento
+        entrenamiento = BitacoraPartidas(os.path.join(tmp, "entrenamiento.jsonl"))
+        for p in partidas[:corte]:
+            entrenamiento.registrar(p["c"], p["r"], p.get("n"), p.get("a"))
+        estadisticas = EstadisticasPreguntas(None)
+        estadisticas.actualizar(entrenamiento, personajes)
+        # Modelo del jugador para las respuestas no grabadas: toda la bitácora
+        jugador = EstadisticasPreguntas(None)
+        jugador.actualizar(bitacora, personajes)
+
+        for nombre, selector in [("anterior", SelectorAnterior(random.Random(1))),
+                                 ("nuevo", SelectorNuevo(estadisticas, random.Random(1)))]:
+            jugadas, preguntas, aciertos = repetir(personajes, partidas[corte:], selector, jugador, random.Random(2))
+            print(f"  {nombre:8}: {preguntas:5.2f} preguntas por partida, {aciertos:6.1%} aciertos ({jugadas} partidas)")
+
+
+if __name__ == "__main__":
+    main()
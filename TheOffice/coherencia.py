@@ -0,0 +1,72 @@
+# ==============================
+# COHERENCIA DE LA BASE DE PERSONAJES
+# ==============================
+# El juego sólo distingue personajes por las respuestas a "¿El <categoría> es
+# '<valor>'?". Dos personajes con exactamente los mismos pares
+# (categoría, valor) en las categorías que se preguntan no se pueden separar
+# con ninguna secuencia de preguntas.
+#
+# En lugar de comparar cada par de personajes, cada uno se reduce a una firma
+# (conjunto congelado de pares) que se usa como llave de un diccionario: los
+# indistinguibles caen en la misma llave. Agregar un personaje nuevo cuesta
+# una búsqueda en ese diccionario.
+#
+# Uso: python coherencia.py [characters.json]
+
+import json
+import sys
+
+# Mismas categorías (y orden) que CATEGORY_ORDER en main.py
+CATEGORIAS = ["rol", "genero", "aspecto", "personalidad", "narrativa", "estilo", "distintivo"]
+
+
+def firma(personaje, categorias=CATEGORIAS):
+    pares = []
+    for categoria in categorias:
+        valor = personaje.get(categoria)
+        if isinstance(valor, list):
+            pares.extend((categoria, v) for v in valor)
+        elif isinstance(valor, str) and valor:
+            pares.append((categoria, valor))
+    return frozenset(pares)
+
+
+class VerificadorPersonajes:
+    def __init__(self, personajes=(), categorias=CATEGORIAS):
+        self.categorias = categorias
+        self.por_nombre = {}   # nombre en minúsculas -> nombre
+        self.por_firma = {}    # firma -> [nombres]
+        self.duplicados = []
+        for personaje in personajes:
+            self.agregar_personaje(personaje)
+
+    def agregar_personaje(self, personaje):
+        """Indexa un personaje; devuelve los nombres de los que no se puede distinguir."""
+        nombre = personaje["nombre"]
+        clave = nombre.lower()
+        if clave in self.por_nombre:
+            self.duplicados.append(nombre)
+        else:
+            self.por_nombre[clave] = nombre
+        grupo = self.por_firma.setdefault(firma(personaje, self.categorias), [])
+        iguales = list(grupo)
+        grupo.append(nombre)
+        return iguales
+
+    def indistinguibles(self):
+        """Grupos (listas de nombres) que ninguna secuencia de preguntas separa."""
+        return [grupo for grupo in self.por_firma.values() if len(grupo) > 1]
+
+
+if __name__ == "__main__":
+    archivo = sys.argv[1] if len(sys.argv) > 1 else "characters.json"
+    with open(archivo, "r", encoding="utf-8") as f:
+        personajes = json.load(f)
+    verificador = VerificadorPersonajes(personajes)
+    print(f"{len(personajes)} personajes revisados")
+    for nombre in verificador.duplicados:
+        print(f"⚠ Personaje repetido: {nombre}")
+    for grupo in verificador.indistinguibles():
+        print(f"⚠ No se pueden distinguir: {', '.join(grupo)}")
+    if not verificador.duplicados and not verificador.indistinguibles():
+        print("Sin problemas: todos los personajes se pueden distinguir")
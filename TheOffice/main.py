@@ -1,9 +1,11 @@
 import json
-import random
 import os
 import tkinter as tk
 from tkinter import ttk
-from PIL import Image, ImageTk  # pip install pillow
+
+from coherencia import VerificadorPersonajes
+from aprendizaje import (ACIERTO, ACTUALIZAR_CADA, FALLO, SIN_CANDIDATOS, BitacoraPartidas,
+                         EstadisticasPreguntas, elegir_pregunta, tiene)
 
 # ==============================
 # CONFIGURACIÓN BÁSICA
@@ -63,6 +65,14 @@ class TheOfficeUI:
         # Estado y datos
         self.ui_mode = "asking"
         self.characters = load_knowledge()
+        self.verificador = VerificadorPersonajes(self.characters, CATEGORY_ORDER)
+        # Bitácora de partidas y estadísticas por rasgo para elegir preguntas
+        self.bitacora = BitacoraPartidas()
+        self.estadisticas = EstadisticasPreguntas()
+        self.partidas_sin_resumir = 0   # partidas anotadas desde la última actualización
+        self.actualizar_estadisticas()
+        self.camino = []
+        self.partida_anotada = True
 
         # ----------------- INTERFAZ -----------------
         # Título centrado (al usar un frame con ancho igual al canvas, pack center funcionará)
@@ -216,12 +226,16 @@ class TheOfficeUI:
         self.yes_btn.config(text="Correcto", bg="#2e8b57", command=self.confirm_yes, state="normal")
         self.no_btn.config(text="Incorrecto", bg="#b22222", command=self.confirm_no, state="normal")
 
-    # ----------------- Lógica principal (motor intacto) -----------------
+    # ----------------- Lógica principal (preguntas elegidas con aprendizaje.py) -----------------
     def reset_game(self):
+        self.terminar_partida()
         self.remaining_chars = self.characters.copy()
         self.asked_features = set()
         self.asked_count = 0
-        self.category_index = 0
+        self.camino = []
+        self.partida_anotada = False
+        self.resultado = None
+        self.adivinado = None
         self.image_label.config(image="", text="")
         self.result_label.config(text="")
         self.restart_btn.pack_forget()
@@ -233,6 +247,7 @@ class TheOfficeUI:
 
     def next_question(self):
         if not self.remaining_chars:
+            self.resultado = SIN_CANDIDATOS
             self.show_message("No estoy seguro de quién podría ser 😔")
             self.show_teach_option()
             return
@@ -241,48 +256,31 @@ class TheOfficeUI:
             self.guess_character(self.remaining_chars[0])
             return
 
-        category = CATEGORY_ORDER[self.category_index % len(CATEGORY_ORDER)]
-        opciones = []
-        for char in self.remaining_chars:
-            value = char.get(category)
-            if isinstance(value, list):
-                for v in value:
-                    if v not in self.asked_features:
-                        opciones.append(v)
-            elif isinstance(value, str):
-                if value not in self.asked_features:
-                    opciones.append(value)
-
-        if not opciones:
-            self.category_index += 1
-            self.next_question()
+        siguiente = elegir_pregunta(self.remaining_chars, self.asked_features, self.estadisticas, CATEGORY_ORDER)
+        if siguiente is None:
+            # Ya no hay nada que preguntar: quedan personajes indistinguibles
+            self.guess_character(self.remaining_chars[0])
             return
 
-        self.feature = random.choice(opciones)
-        pregunta = f"¿El {category} es '{self.feature}'?"
+        self.category, self.feature = siguiente
+        pregunta = f"¿El {self.category} es '{self.feature}'?"
         self.question_label.config(text=pregunta)
-        self.category_index += 1
         self.asked_count += 1
         self.set_buttons_to_answer_mode()
 
     def answer(self, ans):
         if self.ui_mode != "asking":
             return
-        category = CATEGORY_ORDER[(self.category_index - 1) % len(CATEGORY_ORDER)]
-        if ans == "s":
-            self.remaining_chars = [
-                c for c in self.remaining_chars if (self.feature in c.get(category, [])) or (self.feature == c.get(category))
-            ]
-        else:
-            self.remaining_chars = [
-                c for c in self.remaining_chars if not ((self.feature in c.get(category, [])) or (self.feature == c.get(category)))
-            ]
+        si = ans == "s"
+        self.remaining_chars = [c for c in self.remaining_chars if tiene(c, self.category, self.feature) == si]
+        self.camino.append((self.category, self.feature, si))
         self.asked_features.add(self.feature)
         self.next_question()
 
     def guess_character(self, character):
         name = character["nombre"]
         self.current_guess = character
+        self.adivinado = name
         self.question_label.config(text="Creo que estás pensando en...")
         self.show_image(name)
         self.result_label.config(text=f"🕵️‍♂️ {name}")
@@ -290,14 +288,33 @@ class TheOfficeUI:
 
     # ----------------- Confirmaciones -----------------
     def confirm_yes(self):
+        self.resultado = ACIERTO
+        self.terminar_partida(self.current_guess["nombre"])
         self.question_label.config(text="¡Genial! Sabía que lo adivinaría 😏")
         self.yes_btn.config(state="disabled")
         self.no_btn.config(state="disabled")
         self.show_restart_button()
 
     def confirm_no(self):
+        self.resultado = FALLO
         self.open_teach_panel()
 
+    # ----------------- Aprendizaje de partidas -----------------
+    def terminar_partida(self, nombre=None):
+        """Anota la partida en la bitácora (una vez); ``nombre`` es el personaje real si se sabe."""
+        if self.partida_anotada or not self.camino:
+            return
+        self.partida_anotada = True
+        self.bitacora.registrar(self.camino, self.resultado, nombre, self.adivinado)
+        self.partidas_sin_resumir += 1
+        if self.partidas_sin_resumir >= ACTUALIZAR_CADA:
+            self.actualizar_estadisticas()
+
+    def actualizar_estadisticas(self):
+        if self.estadisticas.actualizar(self.bitacora, self.characters):
+            self.estadisticas.guardar()
+        self.partidas_sin_resumir = 0
+
     # ----------------- Enseñanza -----------------
     def open_teach_panel(self):
         self.ui_mode = "teaching"
@@ -321,7 +338,10 @@ class TheOfficeUI:
         if not nombre:
             self.question_label.config(text="El nombre es obligatorio.")
             return
-        if any(c['nombre'].lower() == nombre.lower() for c in self.characters):
+        conocido = next((c for c in self.characters if c['nombre'].lower() == nombre.lower()), None)
+        if conocido:
+            # Sí lo conocía: alguna respuesta no coincidió con sus datos
+            self.terminar_partida(conocido["nombre"])
             self.question_label.config(text="Ya conozco a ese personaje.")
             self.teach_frame_container.pack_forget()
             self.show_restart_button()
@@ -340,7 +360,15 @@ class TheOfficeUI:
 
         self.characters.append(nuevo)
         save_knowledge(self.characters)
-        self.question_label.config(text=f"✅ Aprendí sobre {nombre}. ¡Gracias!")
+        iguales = self.verificador.agregar_personaje(nuevo)
+        self.terminar_partida(nombre)
+        if iguales:
+            self.question_label.config(
+                text=f"✅ Aprendí sobre {nombre}, pero no puedo distinguirlo de: {', '.join(iguales)}. "
+                     "Agrega algún rasgo distinto."
+            )
+        else:
+            self.question_label.config(text=f"✅ Aprendí sobre {nombre}. ¡Gracias!")
         self.show_image(nombre)
         self.result_label.config(text=f"🕵️‍♂️ {nombre}")
         self.teach_frame_container.pack_forget()
@@ -363,6 +391,8 @@ class TheOfficeUI:
 
         if img_path:
             try:
+                # PIL se importa con la primera imagen, no al arrancar
+                from PIL import Image, ImageTk  # pip install pillow
                 img = Image.open(img_path).resize((260, 340))
                 self.char_img = ImageTk.PhotoImage(img)
                 self.image_label.config(image=self.char_img, text="")
@@ -0,0 +1,12 @@
+# ==============================
+# BENCHMARK DEL REPOSITORIO
+# ==============================
+# generadores.py  datos sintéticos (personajes, partidas de Clue, grafos de
+#                 rutas, flujos de comandos del inventario)
+# suite.py        un caso por programa
+# __main__.py     ejecutor sin ventanas, resultados en JSON, cProfile,
+#                 tracemalloc y comparación contra una línea base
+# arranque.py     tiempo hasta el primer cuadro de cada programa (-X importtime)
+#
+# Uso: python -m benchmarks --help
+#      python -m benchmarks.arranque --help
@@ -0,0 +1,170 @@
+# ==============================
+# EJECUTOR DEL BENCHMARK
+# ==============================
+# Corre los casos de suite.py sin ventanas (driver SDL "dummy", matplotlib
+# con Agg, nada de Tk) y deja los resultados en JSON. Opcionalmente:
+#
+#   --memoria          pico de memoria de Python (tracemalloc) en una corrida aparte
+#   --perfil DIR       un .prof de cProfile por caso y las 5 funciones más caras
+#                      (p. ej. benchmarks/perfiles)
+#   --guardar-base     guarda los resultados como línea base (benchmarks/base.json)
+#   --base ARCHIVO     compara contra una línea base; sale con código 1 si la
+#                      mediana de algún caso supera la de la base en más de
+#                      la tolerancia (relativa) y de MIN_DIFERENCIA (absoluta),
+#                      también al volver a medir ese caso
+#
+# Para comparar o guardar una base se corren al menos MIN_REPETICIONES_BASE
+# repeticiones: con una sola, el ruido basta para una "regresión". La base
+# incluida se midió en la máquina de referencia; en otra máquina conviene
+# regenerarla con --guardar-base antes de compararse contra ella.
+#
+# Uso (desde la raíz del repositorio):
+#   python -m benchmarks [--casos tarea1_motor ...] [--escala 1.0] [--salida resultados.json]
+#   python -m benchmarks --guardar-base
+#   python -m benchmarks --base benchmarks/base.json --tolerancia 0.25
+
+import os
+
+# Antes de importar cualquier programa: nada de ventanas ni audio
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+os.environ.setdefault("MPLBACKEND", "Agg")
+
+import argparse
+import cProfile
+import json
+import platform
+import pstats
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+
+from benchmarks.suite import CASOS, Omitido, carpeta
+
+BASE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "base.json")
+TOLERANCIA = 0.25
+MIN_DIFERENCIA = 0.005        # segundos; por debajo es ruido del temporizador
+MIN_REPETICIONES_BASE = 5
+
+
+def medir(nombre, escala, repeticiones, memoria=False, perfil=None):
+    carpeta_caso, preparar = CASOS[nombre]
+    with carpeta(carpeta_caso):
+        try:
+            correr = preparar(escala, random.Random(0))
+        except Omitido as e:
+            return {"omitido": str(e)}
+
+        tiempos = []
+        extra = {}
+        for _ in range(repeticiones):
+            inicio = time.perf_counter()
+            extra = correr() or {}
+            tiempos.append(time.perf_counter() - inicio)
+        resultado = {"segundos": min(tiempos), "mediana": statistics.median(tiempos),
+                     "repeticiones": repeticiones, **extra}
+        if "operaciones" in extra:
+            resultado["operaciones_por_segundo"] = extra["operaciones"] / min(tiempos)
+
+        if memoria:
+            tracemalloc.start()
+            correr()
+            resultado["pico_memoria_kib"] = tracemalloc.get_traced_memory()[1] / 1024
+            tracemalloc.stop()
+
+        if perfil:
+            os.makedirs(perfil, exist_ok=True)
+            perfilador = cProfile.Profile()
+            perfilador.runcall(correr)
+            ruta = os.path.join(perfil, f"{nombre}.prof")
+            perfilador.dump_stats(ruta)
+            estadisticas = pstats.Stats(perfilador).sort_stats("tottime")
+            resultado["perfil"] = ruta
+            resultado["mas_caras"] = [
+                f"{os.path.basename(archivo)}:{linea}({funcion})"
+                for archivo, linea, funcion in estadisticas.fcn_list[:5]
+            ]
+    return resultado
+
+
+def comparar(resultados, base, tolerancia):
+    """Anota "vs_base" (razón de medianas) en cada caso y devuelve {caso: regresión}."""
+    if base.get("escala") != resultados["escala"]:
+        print(f"⚠ La línea base es de escala {base.get('escala')}, no se compara", file=sys.stderr)
+        return {}
+    regresiones = {}
+    for nombre, actual in resultados["casos"].items():
+        anterior = base.get("casos", {}).get(nombre, {})
+        if "mediana" not in actual or "mediana" not in anterior:
+            continue
+        razon = actual["mediana"] / anterior["mediana"]
+        actual["vs_base"] = round(razon, 3)
+        if razon > 1 + tolerancia and actual["mediana"] - anterior["mediana"] > MIN_DIFERENCIA:
+            regresiones[nombre] = f"{nombre}: mediana {anterior['mediana']:.3f} s -> {actual['mediana']:.3f} s ({razon:.2f}x)"
+    return regresiones
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Benchmark de todos los programas")
+    parser.add_argument("--casos", nargs="+", choices=sorted(CASOS), default=list(CASOS))
+    parser.add_argument("--escala", type=float, default=1.0, help="multiplica el tamaño de los datos")
+    parser.add_argument("--repeticiones", type=int, default=3,
+                        help=f"con --base o --guardar-base se usan al menos {MIN_REPETICIONES_BASE}")
+    parser.add_argument("--memoria", action="store_true", help="medir pico de memoria con tracemalloc")
+    parser.add_argument("--perfil", metavar="DIR", help="guardar perfiles de cProfile en DIR")
+    parser.add_argument("--salida", help="archivo JSON de resultados (por defecto a la salida estándar)")
+    parser.add_argument("--base", help=f"línea base con la que comparar (p. ej. {os.path.relpath(BASE_FILE)})")
+    parser.add_argument("--guardar-base", action="store_true", help=f"escribir los resultados en {os.path.relpath(BASE_FILE)}")
+    parser.add_argument("--tolerancia", type=float, default=TOLERANCIA)
+    args = parser.parse_args(argv)
+    if (args.base or args.guardar_base) and args.repeticiones < MIN_REPETICIONES_BASE:
+        args.repeticiones = MIN_REPETICIONES_BASE
+
+    resultados = {
+        "fecha": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "escala": args.escala,
+        "casos": {},
+    }
+    for nombre in args.casos:
+        resultado = medir(nombre, args.escala, args.repeticiones, args.memoria, args.perfil)
+        resultados["casos"][nombre] = resultado
+        if "omitido" in resultado:
+            print(f"{nombre:22} omitido: {resultado['omitido']}", file=sys.stderr)
+        else:
+            print(f"{nombre:22} {resultado['segundos'] * 1000:10.1f} ms  (mediana {resultado['mediana'] * 1000:.1f} ms)",
+                  file=sys.stderr)
+
+    regresiones = []
+    if args.base:
+        with open(args.base, "r", encoding="utf-8") as f:
+            base = json.load(f)
+        sospechosos = comparar(resultados, base, args.tolerancia)
+        # Una regresión sólo cuenta si se repite al medir el caso otra vez
+        for nombre in sospechosos:
+            print(f"{nombre:22} más lento que la base, se vuelve a medir", file=sys.stderr)
+            resultados["casos"][nombre] = medir(nombre, args.escala, args.repeticiones, args.memoria, args.perfil)
+        confirmadas = comparar(resultados, base, args.tolerancia)
+        regresiones = [confirmadas[nombre] for nombre in sospechosos if nombre in confirmadas]
+        resultados["regresiones"] = regresiones
+        for regresion in regresiones:
+            print(f"⚠ Regresión: {regresion}", file=sys.stderr)
+
+    texto = json.dumps(resultados, indent=2, ensure_ascii=False)
+    if args.salida:
+        with open(args.salida, "w", encoding="utf-8") as f:
+            f.write(texto + "\n")
+    else:
+        print(texto)
+    if args.guardar_base:
+        with open(BASE_FILE, "w", encoding="utf-8") as f:
+            f.write(texto + "\n")
+    return 1 if regresiones else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
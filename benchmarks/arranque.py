@@ -0,0 +1,131 @@
+# ==============================
+# BENCHMARK DE ARRANQUE
+# ==============================
+# Tiempo hasta el primer cuadro de cada programa. Cada medición es un proceso
+# nuevo de Python con -X importtime que importa el programa, hace lo mínimo
+# para mostrar algo (primer cuadro de Tk o de pygame, o la Q-table de
+# Practica1) y termina. Se reporta:
+#
+#   primer_cuadro_ms   tiempo total del proceso (incluye arrancar Python)
+#   importaciones_ms   suma de las importaciones de primer nivel según -X importtime
+#   mas_pesadas        las importaciones de primer nivel más caras
+#
+# Como referencia también se mide "python -c pass". Sin pantalla Tk no puede
+# dibujar: el caso queda con el error, pero las importaciones sí se miden.
+#
+# Uso (desde la raíz del repositorio):
+#   python -m benchmarks.arranque [--programas clue practica1] [--repeticiones 5] [--salida arranque.json]
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+from benchmarks.suite import RAIZ
+
+# Explotacion_vs_exploracion no termina en .py: se carga por ruta
+_CARGAR_PRACTICA1 = """
+import importlib.util
+from importlib.machinery import SourceFileLoader
+cargador = SourceFileLoader("programa", "Explotacion_vs_exploracion")
+programa = importlib.util.module_from_spec(importlib.util.spec_from_loader("programa", cargador))
+cargador.exec_module(programa)
+"""
+
+# nombre -> (carpeta, código que llega al primer cuadro)
+PROGRAMAS = {
+    "theoffice": ("TheOffice", """
+import tkinter as tk
+import main
+root = tk.Tk()
+app = main.TheOfficeUI(root)
+root.update()
+"""),
+    "clue": ("Clue", """
+import Clue_Restaurante_Prototype as juego
+juego.iniciar()
+juego.screen_title()
+juego.pygame.display.flip()
+"""),
+    "practica1": ("Practica1", _CARGAR_PRACTICA1 + """
+programa.entrenar(programa.crear_grafo())
+"""),
+    "practica1_grafica": ("Practica1", _CARGAR_PRACTICA1 + """
+G = programa.crear_grafo()
+programa.dibujar(G)
+programa.entrenar(G)
+"""),
+}
+
+
+def importaciones(stderr):
+    """Suma y lista las importaciones de primer nivel de la salida de -X importtime."""
+    primer_nivel = []
+    for linea in stderr.splitlines():
+        if not linea.startswith("import time:") or "imported package" in linea:
+            continue
+        _, acumulado, paquete = linea.split("|")
+        if not paquete.startswith(" ") or paquete.startswith("  "):
+            continue   # importación anidada (ya cuenta en la de su padre)
+        primer_nivel.append((int(acumulado) / 1000, paquete.strip()))
+    primer_nivel.sort(reverse=True)
+    return sum(ms for ms, _ in primer_nivel), primer_nivel
+
+
+def medir(carpeta, codigo, repeticiones):
+    entorno = dict(os.environ, SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy",
+                   PYGAME_HIDE_SUPPORT_PROMPT="1", MPLBACKEND="Agg")
+    mejor = None
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        proceso = subprocess.run([sys.executable, "-X", "importtime", "-c", codigo], cwd=os.path.join(RAIZ, carpeta),
+                                 env=entorno, capture_output=True, text=True)
+        total = (time.perf_counter() - inicio) * 1000
+        if mejor is None or total < mejor[0]:
+            mejor = (total, proceso)
+    total, proceso = mejor
+    suma, primer_nivel = importaciones(proceso.stderr)
+    resultado = {
+        "importaciones_ms": round(suma, 1),
+        "mas_pesadas": [f"{paquete} {ms:.1f} ms" for ms, paquete in primer_nivel[:5]],
+    }
+    if proceso.returncode == 0:
+        resultado["primer_cuadro_ms"] = round(total, 1)
+    else:
+        errores = [l for l in proceso.stderr.splitlines() if not l.startswith("import time:")]
+        resultado["error"] = errores[-1] if errores else f"código {proceso.returncode}"
+    return resultado
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.arranque", description="Tiempo de arranque de cada programa")
+    parser.add_argument("--programas", nargs="+", choices=sorted(PROGRAMAS), default=list(PROGRAMAS))
+    parser.add_argument("--repeticiones", type=int, default=5, help="se toma la corrida más rápida")
+    parser.add_argument("--salida", help="archivo JSON de resultados (por defecto a la salida estándar)")
+    args = parser.parse_args(argv)
+
+    resultados = {"python": medir(".", "pass", args.repeticiones), "programas": {}}
+    print(f"{'python -c pass':18} {resultados['python']['primer_cuadro_ms']:8.1f} ms", file=sys.stderr)
+    for nombre in args.programas:
+        carpeta, codigo = PROGRAMAS[nombre]
+        resultado = medir(carpeta, codigo, args.repeticiones)
+        resultados["programas"][nombre] = resultado
+        if "error" in resultado:
+            print(f"{nombre:18} error: {resultado['error']} (importaciones {resultado['importaciones_ms']:.1f} ms)",
+                  file=sys.stderr)
+        else:
+            print(f"{nombre:18} {resultado['primer_cuadro_ms']:8.1f} ms hasta el primer cuadro "
+                  f"(importaciones {resultado['importaciones_ms']:.1f} ms)", file=sys.stderr)
+
+    texto = json.dumps(resultados, indent=2, ensure_ascii=False)
+    if args.salida:
+        with open(args.salida, "w", encoding="utf-8") as f:
+            f.write(texto + "\n")
+    else:
+        print(texto)
+
+
+if __name__ == "__main__":
+    main()
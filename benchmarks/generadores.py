@@ -0,0 +1,102 @@
+# ==============================
+# GENERADORES DE DATOS SINTÉTICOS
+# ==============================
+# Datos con la misma forma que usan los programas del repositorio, en el
+# tamaño que se pida. Todos reciben un random.Random para ser reproducibles.
+
+import random
+
+# Misma forma que TheOffice/characters.json: categorías de texto y de lista
+CATEGORIAS_PERSONAJE = {
+    "rol": (15, None), "genero": (2, None), "aspecto": (60, 3), "personalidad": (80, 4),
+    "narrativa": (2, None), "estilo": (60, 2), "distintivo": (120, 3),
+}
+
+
+def personajes(n, rnd=random):
+    """Base de ``n`` personajes; algunos repiten rasgos a propósito para que haya
+    grupos indistinguibles (como pasa al enseñar personajes a mano)."""
+    base = []
+    for i in range(n):
+        if base and rnd.random() < 0.02:
+            copia = dict(rnd.choice(base))
+            copia["nombre"] = f"Personaje {i}"
+            base.append(copia)
+            continue
+        p = {"nombre": f"Personaje {i}"}
+        for categoria, (valores, por_lista) in CATEGORIAS_PERSONAJE.items():
+            if por_lista:
+                p[categoria] = [f"{categoria} {v:03d}" for v in rnd.sample(range(valores), por_lista)]
+            else:
+                p[categoria] = f"{categoria} {rnd.randrange(valores):03d}"
+        base.append(p)
+    return base
+
+
+def escenarios_clue(n, sospechosos, ingredientes, lugares, rnd=random, max_acusaciones=6):
+    """Paquete de ``n`` partidas de Clue: combinación secreta y las acusaciones
+    (índices) que hace el jugador; la última siempre es la correcta."""
+    paquete = []
+    for _ in range(n):
+        secreto = (rnd.randrange(len(sospechosos)), rnd.randrange(len(ingredientes)), rnd.randrange(len(lugares)))
+        acusaciones = []
+        for _ in range(rnd.randint(0, max_acusaciones - 1)):
+            intento = (rnd.randrange(len(sospechosos)), rnd.randrange(len(ingredientes)), rnd.randrange(len(lugares)))
+            if intento != secreto:
+                acusaciones.append(intento)
+        acusaciones.append(secreto)
+        paquete.append({
+            "culpable": sospechosos[secreto[0]],
+            "ingrediente": ingredientes[secreto[1]],
+            "lugar": lugares[secreto[2]],
+            "acusaciones": acusaciones,
+            "pistas_pedidas": rnd.randint(1, 8),
+        })
+    return paquete
+
+
+def grafo_rutas(n_nodos, grado, rnd=random, inicio="Home", meta="Goal"):
+    """Grafo dirigido en capas de ``inicio`` a ``meta`` con recompensas, en la
+    forma {lugar: {vecino: {"reward": r}}}. Todo camino llega a la meta."""
+    intermedios = [f"Tienda{i}" for i in range(max(n_nodos - 2, 1))]
+    ancho = max(grado, 1)
+    capas = [[inicio]] + [intermedios[i:i + ancho] for i in range(0, len(intermedios), ancho)] + [[meta]]
+    grafo = {nodo: {} for capa in capas for nodo in capa}
+    for actual, siguiente in zip(capas, capas[1:]):
+        for nodo in actual:
+            for vecino in rnd.sample(siguiente, min(grado, len(siguiente))):
+                grafo[nodo][vecino] = {"reward": rnd.randint(1, 10)}
+    return grafo
+
+
+def comandos_inventario(n, piezas, preguntas, rnd=random):
+    """Flujo de ``n`` diálogos del chatbot SMT (líneas que escribiría un técnico).
+
+    Mezcla preguntas conocidas, consultas y búsquedas del inventario, retiros
+    (con piezas que a veces no existen o sin stock) y altas de piezas nuevas.
+    """
+    lineas = []
+    for i in range(n):
+        r = rnd.random()
+        if r < 0.30:
+            lineas.append(rnd.choice(preguntas))
+        elif r < 0.40:
+            lineas.append("consultar inventario")
+        elif r < 0.50:
+            pieza = rnd.choice(piezas)
+            lineas.append(f"buscar {pieza[:max(2, len(pieza) // 2)]}")
+        elif r < 0.90:
+            # Texto desconocido -> "no" -> el chatbot pasa al retiro
+            lineas += [f"texto desconocido {i}", "no"] + _retiro(piezas, rnd, i)
+        else:
+            # Alta de una pieza nueva; después del alta también se pide un retiro
+            lineas += [f"refaccion nueva {i}", "sí", str(rnd.randint(1, 100)), f"Respuesta {i}"]
+            lineas += _retiro(piezas, rnd, i)
+    lineas.append("salir")
+    return lineas
+
+
+def _retiro(piezas, rnd, i):
+    if rnd.random() < 0.05:
+        return [f"pieza rara {i}"]   # no existe: el chatbot vuelve a la pregunta inicial
+    return [rnd.choice(piezas), str(rnd.randint(1, 5)), f"tecnico{rnd.randrange(50)}"]
@@ -0,0 +1,210 @@
+# ==============================
+# CASOS DEL BENCHMARK
+# ==============================
+# Cada caso recibe (escala, rnd), genera sus datos y devuelve una función
+# correr() sin argumentos: eso es lo único que se cronometra. correr() puede
+# devolver métricas extra; si incluye "operaciones" el ejecutor calcula
+# operaciones por segundo.
+#
+# Los programas viven en carpetas sueltas (con espacios y módulos con el mismo
+# nombre, p. ej. coherencia.py en Tarea1 y en TheOffice), así que cada caso
+# corre dentro de carpeta(...), que pone esa carpeta en sys.path y al salir
+# olvida los módulos que cargó de ella.
+
+import asyncio
+import importlib
+import importlib.machinery
+import importlib.util
+import os
+import random
+import re
+import sys
+import tempfile
+from contextlib import contextmanager
+
+from benchmarks import generadores
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class Omitido(Exception):
+    """El caso no se puede correr aquí (falta una dependencia opcional)."""
+
+
+@contextmanager
+def carpeta(nombre):
+    ruta = os.path.join(RAIZ, nombre)
+    antes = set(sys.modules)
+    sys.path.insert(0, ruta)
+    try:
+        yield ruta
+    finally:
+        sys.path.remove(ruta)
+        for modulo in set(sys.modules) - antes:
+            archivo = getattr(sys.modules[modulo], "__file__", None) or ""
+            if archivo.startswith(ruta + os.sep):
+                del sys.modules[modulo]
+
+
+def cargar(ruta):
+    """Carga un script por ruta (también los que no terminan en .py)."""
+    nombre = re.sub(r"\W", "_", os.path.basename(ruta))
+    cargador = importlib.machinery.SourceFileLoader(nombre, ruta)
+    modulo = importlib.util.module_from_spec(importlib.util.spec_from_loader(nombre, cargador))
+    try:
+        cargador.exec_module(modulo)
+    except ImportError as e:
+        raise Omitido(f"{e.name or e} no está instalado") from e
+    return modulo
+
+
+# ----------------- TheOffice -----------------
+def theoffice_personajes(escala, rnd):
+    """Base grande de personajes: coherencia + partidas completas con elegir_pregunta()."""
+    from aprendizaje import tiene
+    from bench_preguntas import SelectorNuevo, jugar
+    from coherencia import VerificadorPersonajes
+
+    base = generadores.personajes(max(int(500 * escala), 2), rnd)
+    objetivos = [rnd.choice(base) for _ in range(max(int(20 * escala), 1))]
+
+    def correr():
+        verificador = VerificadorPersonajes(base)
+        selector = SelectorNuevo(None, random.Random(1))
+        preguntas = 0
+        for objetivo in objetivos:
+            camino, _, _ = jugar(base, selector, lambda c, v: tiene(objetivo, c, v))
+            preguntas += len(camino)
+        return {
+            "operaciones": len(objetivos),
+            "preguntas_por_partida": round(preguntas / len(objetivos), 2),
+            "grupos_indistinguibles": len(verificador.indistinguibles()),
+        }
+    return correr
+
+
+# ----------------- Clue -----------------
+def clue_escenarios(escala, rnd):
+    """Paquetes de partidas: pistas, acusaciones y un cuadro por escena (driver SDL dummy)."""
+    juego = cargar(os.path.join(RAIZ, "Clue", "Clue_Restaurante_Prototype.py"))
+    juego.iniciar()
+    pygame = juego.pygame
+    paquete = generadores.escenarios_clue(max(int(100 * escala), 1), juego.SUSPECTS, juego.INGREDIENTS,
+                                          juego.PLACES, rnd)
+
+    def correr():
+        cuadros = 0
+        for escenario in paquete:
+            estado = juego.GameState()
+            estado.secret_suspect = escenario["culpable"]
+            estado.secret_ingredient = escenario["ingrediente"]
+            estado.secret_place = escenario["lugar"]
+            estado.generate_initial_clues()
+            juego.state = estado
+            juego.screen_title()
+            for _ in range(escenario["pistas_pedidas"]):
+                estado.next_clue()
+            for acusacion in escenario["acusaciones"]:
+                estado.selected = list(acusacion)
+                correcto, adivinado = estado.accuse(*acusacion)
+                if not correcto:
+                    estado.pistas.append(juego.generar_pista_extra(estado, adivinado))
+                juego.screen_investigate()
+                juego.screen_accuse()
+                juego.screen_result(correcto, adivinado)
+                pygame.display.flip()
+                cuadros += 3
+        return {"operaciones": cuadros, "escenarios": len(paquete)}
+    return correr
+
+
+# ----------------- Practica1 -----------------
+def practica1_rutas(escala, rnd):
+    """Q-learning de Explotacion_vs_exploracion sobre grafos de rutas aleatorios."""
+    programa = cargar(os.path.join(RAIZ, "Practica1", "Explotacion_vs_exploracion"))
+    grafos = [generadores.grafo_rutas(max(int(200 * escala), 3), 4, rnd) for _ in range(5)]
+    episodios = 200
+
+    def correr():
+        aleatorio = random.Random(1)
+        for grafo in grafos:
+            programa.entrenar(grafo, episodes=episodios, rnd=aleatorio)
+        return {"operaciones": len(grafos) * episodios}
+    return correr
+
+
+# ----------------- Practica 2 -----------------
+def inventario_comandos(escala, rnd):
+    """Flujo de comandos del chatbot SMT contra el libro de inventario (SQLite)."""
+    from datos_smt import CONOCIMIENTO_INICIAL, INVENTARIO_INICIAL
+    from inventario_db import Inventario
+    from servidor import FIN, Conversacion, Escritor
+
+    inicial = dict(INVENTARIO_INICIAL)
+    inicial.update({f"pieza {i:04d}": 1000 for i in range(max(int(500 * escala), 1))})
+    lineas = generadores.comandos_inventario(max(int(2000 * escala), 1), sorted(inicial),
+                                             sorted(CONOCIMIENTO_INICIAL), rnd)
+
+    async def conversar(ruta):
+        inventario = Inventario(ruta)
+        inventario.sembrar(inicial)
+        escritor = Escritor(inventario, dict(CONOCIMIENTO_INICIAL))
+        escritor.iniciar()
+        conversacion = Conversacion(escritor)
+        conversacion.inicio()
+        try:
+            for linea in lineas:
+                await conversacion.responder(linea)
+                if conversacion.estado == FIN:
+                    break
+        finally:
+            await escritor.detener()
+            inventario.close()
+
+    def correr():
+        with tempfile.TemporaryDirectory() as tmp:
+            asyncio.run(conversar(os.path.join(tmp, "inventario.db")))
+        return {"operaciones": len(lineas)}
+    return correr
+
+
+# ----------------- Tarea1 / Tarea 3 -----------------
+def tarea1_motor(escala, rnd):
+    """Compilar la red Rete y consultar desde cero con la mitad de los síntomas."""
+    from bench_motor import generar_reglas
+    from motor_inferencia import MotorRete
+
+    sintomas, reglas = generar_reglas(max(int(5000 * escala), 8), 60, 4, rnd)
+    consultas = [{s: True for s in rnd.sample(sintomas, len(sintomas) // 2)} for _ in range(20)]
+
+    def correr():
+        motor = MotorRete(reglas)
+        for hechos in consultas:
+            motor.consultar(hechos)
+        return {"operaciones": len(consultas), "nodos": motor.num_nodos()}
+    return correr
+
+
+def tarea3_atras(escala, rnd):
+    """Encadenamiento hacia atrás con tablas sobre una cadena profunda con relleno."""
+    from bench_encadenamiento import reglas_grandes
+    from encadenamiento_atras import ResolvedorAtras
+
+    reglas, hechos, meta = reglas_grandes(max(int(2000 * escala), 1), max(int(20_000 * escala), 1), rnd)
+
+    def correr():
+        resolvedor = ResolvedorAtras(reglas, hechos)
+        probado = resolvedor.probar(meta)
+        return {"operaciones": resolvedor.expansiones, "probado": probado}
+    return correr
+
+
+# nombre -> (carpeta, función)
+CASOS = {
+    "theoffice_personajes": ("TheOffice", theoffice_personajes),
+    "clue_escenarios": ("Clue", clue_escenarios),
+    "practica1_rutas": ("Practica1", practica1_rutas),
+    "inventario_comandos": ("Practica 2", inventario_comandos),
+    "tarea1_motor": ("Tarea1", tarea1_motor),
+    "tarea3_atras": ("Tarea 3", tarea3_atras),
+}